@@ -4,7 +4,6 @@ Comprehensive Python format validation script
 Tests all Python-based formats with their respective libraries
 """
 
-import ast
 import sys
 import tempfile
 from pathlib import Path
@@ -24,7 +23,7 @@ def test_format_with_library(format_name: str, code: str, test_func) -> dict[str
     try:
         # First test Python syntax (skip for non-Python formats)
         if format_name not in ["graphql", "jsonschema", "avro"]:
-            ast.parse(code)
+            compile(code, f"<{format_name}>", "exec")
         result["syntax_valid"] = True
 
         # Then test with the specific library
@@ -5,7 +5,6 @@ This script can be run in CI/CD to ensure all generators produce valid output.
 """
 
 import argparse
-import ast
 import json
 import subprocess
 import sys
@@ -101,7 +100,7 @@ class FormatValidator:
         result = {"valid": False, "error": None, "details": {}}
 
         try:
-            ast.parse(code)
+            compile(code, f"<{format_name}>", "exec")
             result["valid"] = True
             result["details"]["parsed"] = True
         except SyntaxError as e:
@@ -73,10 +73,22 @@ class Config:
         if not config_file.exists():
             return cls()  # Return default config
 
-        # Execute the config file and extract the config object
+        return cls._from_source(config_file.read_text(), config_path)
+
+    @classmethod
+    def _from_source(cls, source: str, config_path: str) -> "Config":
+        """Execute configuration source and return the config it defines
+
+        Args:
+            source: Python source of the configuration file
+            config_path: Path reported in error messages
+
+        Returns:
+            Config instance
+        """
         try:
             namespace = {}
-            exec(config_file.read_text(), namespace)
+            exec(source, namespace)
         except SyntaxError as e:
             raise SyntaxError(
                 f"Syntax error in config file '{config_path}': {e}"
@@ -3,6 +3,7 @@
 import importlib.util
 import inspect
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -69,6 +70,10 @@ class SchemaGenerationEngine:
         if not schema_files:
             raise ValueError(f"No Python files found in {schema_dir}")
 
+        # Reloading re-executes the schema modules and creates new classes,
+        # so USR schemas parsed from the previous classes are stale.
+        self.parser.invalidate()
+
         # Import each schema file to trigger @Schema registration
         for schema_file in schema_files:
             if schema_file.name.startswith("__"):
@@ -156,10 +161,16 @@ class SchemaGenerationEngine:
             schema_filename = generator.get_schema_filename(schema)
             schema_file = target_dir / schema_filename
 
-            file_content = generator.generate_file(schema)
-
-            with open(schema_file, "w") as f:
-                f.write(file_content)
+            # Stream into a sibling temp file and swap it in, so a generator
+            # error leaves the previous file intact instead of truncated
+            tmp_file = schema_file.with_name(f".{schema_filename}.{os.getpid()}.tmp")
+            try:
+                with open(tmp_file, "w") as f:
+                    generator.generate_file_to(schema, f)
+                os.replace(tmp_file, schema_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
 
             print(f"  \u2713 {schema_filename}")
 
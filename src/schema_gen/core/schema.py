@@ -1,6 +1,7 @@
 """Core schema definition API for schema_gen"""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import Any, get_type_hints
 
@@ -190,6 +191,22 @@ class SchemaRegistry:
         """Get all registered schemas"""
         return cls._schemas.copy()
 
+    @classmethod
+    @contextmanager
+    def isolated(cls) -> Iterator[None]:
+        """Run a block against an empty registry
+
+        Schemas registered inside the block are discarded on exit and the
+        previous registrations are restored, so callers need not clear the
+        shared registry by hand.
+        """
+        saved = cls._schemas
+        cls._schemas = {}
+        try:
+            yield
+        finally:
+            cls._schemas = saved
+
 
 def Schema(cls: type) -> type:
     """Decorator to mark a class as a schema definition
@@ -8,7 +8,7 @@ from enum import Enum
 from typing import Any, Optional, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """Result of a single validation check on a USR schema or field"""
 
@@ -96,7 +96,8 @@ class USREnum:
     docstring: str | None = None
 
 
-@dataclass
+# Slotted: generators read these attributes in their innermost loops.
+@dataclass(slots=True)
 class USRField:
     """Universal representation of a schema field"""
 
@@ -243,7 +244,7 @@ class USRField:
         return issues
 
 
-@dataclass
+@dataclass(slots=True)
 class USRSchema:
     """Universal representation of a complete schema"""
 
@@ -257,6 +258,12 @@ class USRSchema:
     # Variants configuration
     variants: dict[str, list[str]] = field(default_factory=dict)
 
+    # PascalCase suffix per variant name ("create_request" -> "CreateRequest").
+    # Filled by the parser; computed on first use for schemas built directly.
+    variant_class_names: dict[str, str] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
     # Custom code sections for complex model features
     custom_code: dict[str, Any] = field(default_factory=dict)
 
@@ -325,9 +332,17 @@ class USRSchema:
                 f"Available: {list(self.variants.keys())}"
             )
 
-        variant_field_names = self.variants[variant_name]
+        variant_field_names = set(self.variants[variant_name])
         return [f for f in self.fields if f.name in variant_field_names]
 
+    def get_variant_class_name(self, variant_name: str) -> str:
+        """Get the PascalCase class name for a variant (e.g. UserCreateRequest)"""
+        suffix = self.variant_class_names.get(variant_name)
+        if suffix is None:
+            suffix = "".join(word.capitalize() for word in variant_name.split("_"))
+            self.variant_class_names[variant_name] = suffix
+        return self.name + suffix
+
     def validate(self) -> list[ValidationIssue]:
         """Validate this schema for common misconfigurations.
 
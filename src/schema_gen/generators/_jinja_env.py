@@ -0,0 +1,78 @@
+"""Shared Jinja2 environment for template-based generators
+
+Generators register their template source under a stable name and render
+through a single module-level ``Environment``. The environment keeps every
+compiled template in memory for the life of the process, and a filesystem
+bytecode cache persists the compiled bytecode between processes so repeated
+CLI invocations (Makefiles, CI steps, pre-commit hooks) skip template
+compilation entirely.
+"""
+
+import contextlib
+import hashlib
+
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, Template
+from jinja2.bccache import Bucket
+
+#: Template sources keyed by name and source digest. Backs the environment's
+#: ``DictLoader``; populated lazily by :func:`get_template`.
+_TEMPLATE_SOURCES: dict[str, str] = {}
+
+
+class _BestEffortBytecodeCache(FileSystemBytecodeCache):
+    """Filesystem bytecode cache that never fails template loading.
+
+    The cache is purely an optimization: an unreadable, corrupt or
+    read-only cache directory falls back to compiling from source instead
+    of breaking code generation.
+    """
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except (OSError, EOFError, ValueError):
+            bucket.reset()
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        with contextlib.suppress(OSError):
+            super().dump_bytecode(bucket)
+
+
+def _make_bytecode_cache() -> FileSystemBytecodeCache | None:
+    """Create the bytecode cache, or None when no safe directory exists."""
+    try:
+        return _BestEffortBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+# Whitespace handling (trim_blocks / lstrip_blocks) is left at Jinja's
+# defaults: the generator templates control whitespace explicitly with
+# ``{%-`` markers, and changing the defaults would alter generated output.
+ENV = Environment(
+    loader=DictLoader(_TEMPLATE_SOURCES),
+    autoescape=False,
+    auto_reload=False,
+    bytecode_cache=_make_bytecode_cache(),
+)
+
+
+def get_template(name: str, source: str) -> Template:
+    """Return the compiled template registered under ``name``.
+
+    Templates are registered under ``name`` plus a digest of ``source``, so
+    a subclass that overrides its generator's template source gets its own
+    compiled template instead of whichever source was registered first.
+    Later calls with the same name and source reuse the compiled template.
+
+    Args:
+        name: Stable template name, used as the bytecode cache key prefix
+        source: Jinja2 template source
+
+    Returns:
+        Compiled template owned by the shared environment
+    """
+    digest = hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+    key = f"{name}-{digest}"
+    _TEMPLATE_SOURCES.setdefault(key, source)
+    return ENV.get_template(key)
@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import IO
 
 from ..core.config import Config
 from ..core.usr import USRSchema
@@ -95,6 +96,20 @@ class BaseGenerator(ABC):
         """
         ...
 
+    def generate_file_to(self, schema: USRSchema, out: IO[str]) -> None:
+        """Write the complete file for the given schema to a text stream.
+
+        The default implementation writes the result of ``generate_file()``
+        in one call. Generators that can emit their output incrementally
+        override this to write each model as it is built, so peak memory is
+        bounded by the largest single model rather than the whole file.
+
+        Args:
+            schema: USR schema to generate from
+            out: Writable text stream (e.g. an open file or ``io.StringIO``)
+        """
+        out.write(self.generate_file(schema))
+
     @abstractmethod
     def generate_model(self, schema: USRSchema, variant: str | None = None) -> str:
         """Generate a model for a specific schema variant.
@@ -2,9 +2,8 @@
 
 from pathlib import Path
 
-from jinja2 import Template
-
 from ..core.usr import FieldType, USRField, USRSchema
+from ._jinja_env import get_template
 from .base import BaseGenerator
 
 
@@ -12,7 +11,7 @@ class DataclassesGenerator(BaseGenerator):
     """Generates Python dataclasses from USR schemas"""
 
     def __init__(self):
-        self.template = Template(self._get_template())
+        self.template = get_template("dataclasses_model", self._get_template())
 
     @property
     def file_extension(self) -> str:
@@ -32,7 +31,7 @@ class DataclassesGenerator(BaseGenerator):
         for schema in schemas:
             base_class = schema.name
             variant_classes = [
-                self._variant_to_class_name(schema.name, v) for v in schema.variants
+                schema.get_variant_class_name(v) for v in schema.variants
             ]
             all_classes = [base_class] + variant_classes
             lines.append(
@@ -43,7 +42,7 @@ class DataclassesGenerator(BaseGenerator):
         for schema in schemas:
             base_class = schema.name
             variant_classes = [
-                self._variant_to_class_name(schema.name, v) for v in schema.variants
+                schema.get_variant_class_name(v) for v in schema.variants
             ]
             all_classes = [f'"{c}"' for c in [base_class] + variant_classes]
             lines.append(f"    {', '.join(all_classes)},")
@@ -66,7 +65,7 @@ class DataclassesGenerator(BaseGenerator):
         # Determine the class name
         class_name = schema.name
         if variant:
-            class_name = self._variant_to_class_name(schema.name, variant)
+            class_name = schema.get_variant_class_name(variant)
 
         # Generate field definitions with proper ordering
         # Required fields must come before optional/default fields in dataclasses
@@ -171,7 +170,7 @@ class DataclassesGenerator(BaseGenerator):
             # Combine required fields first, then optional fields
             variant_field_defs = variant_required_fields + variant_optional_fields
 
-            variant_class_name = self._variant_to_class_name(schema.name, variant_name)
+            variant_class_name = schema.get_variant_class_name(variant_name)
             variant_dataclass = self._generate_single_dataclass(
                 variant_class_name,
                 schema.description,
@@ -361,12 +360,6 @@ class DataclassesGenerator(BaseGenerator):
 
         return type_annotation
 
-    def _variant_to_class_name(self, schema_name: str, variant_name: str) -> str:
-        """Convert variant name to PascalCase class name"""
-        parts = variant_name.split("_")
-        variant_pascal = "".join(word.capitalize() for word in parts)
-        return f"{schema_name}{variant_pascal}"
-
     def _generate_single_dataclass(
         self,
         class_name: str,
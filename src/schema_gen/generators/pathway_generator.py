@@ -2,9 +2,8 @@
 
 from pathlib import Path
 
-from jinja2 import Template
-
 from ..core.usr import FieldType, USRField, USRSchema
+from ._jinja_env import get_template
 from .base import BaseGenerator
 
 
@@ -12,7 +11,7 @@ class PathwayGenerator(BaseGenerator):
     """Generates Pathway table schemas from USR schemas"""
 
     def __init__(self):
-        self.template = Template(self._get_template())
+        self.template = get_template("pathway_schema", self._get_template())
 
     @property
     def file_extension(self) -> str:
@@ -32,7 +31,7 @@ class PathwayGenerator(BaseGenerator):
         for schema in schemas:
             base_class = schema.name
             variant_classes = [
-                self._variant_to_class_name(schema.name, v) for v in schema.variants
+                schema.get_variant_class_name(v) for v in schema.variants
             ]
             all_classes = [base_class] + variant_classes
             lines.append(
@@ -43,7 +42,7 @@ class PathwayGenerator(BaseGenerator):
         for schema in schemas:
             base_class = schema.name
             variant_classes = [
-                self._variant_to_class_name(schema.name, v) for v in schema.variants
+                schema.get_variant_class_name(v) for v in schema.variants
             ]
             all_classes = [f'"{c}"' for c in [base_class] + variant_classes]
             lines.append(f"    {', '.join(all_classes)},")
@@ -66,7 +65,7 @@ class PathwayGenerator(BaseGenerator):
         # Determine the class name
         class_name = schema.name
         if variant:
-            class_name = self._variant_to_class_name(schema.name, variant)
+            class_name = schema.get_variant_class_name(variant)
 
         # Generate column definitions
         column_definitions = []
@@ -122,7 +121,7 @@ class PathwayGenerator(BaseGenerator):
                 variant_columns.append(col_def)
                 all_imports.update(col_imports)
 
-            variant_class_name = self._variant_to_class_name(schema.name, variant_name)
+            variant_class_name = schema.get_variant_class_name(variant_name)
             variant_schema = self._generate_single_schema(
                 variant_class_name,
                 schema.description,
@@ -233,12 +232,6 @@ class PathwayGenerator(BaseGenerator):
             imports.add("typing")
             return "typing.Any"
 
-    def _variant_to_class_name(self, schema_name: str, variant_name: str) -> str:
-        """Convert variant name to PascalCase class name"""
-        parts = variant_name.split("_")
-        variant_pascal = "".join(word.capitalize() for word in parts)
-        return f"{schema_name}{variant_pascal}"
-
     def _generate_single_schema(
         self,
         class_name: str,
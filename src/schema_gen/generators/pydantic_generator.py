@@ -5,10 +5,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Template
-
 from ..core.config import Config
 from ..core.usr import FieldType, USREnum, USRField, USRSchema
+from ._jinja_env import get_template
 from .base import BaseGenerator
 
 #: Pydantic ``ConfigDict`` keys honored by ``Config.pydantic``. Any other
@@ -54,7 +53,7 @@ class PydanticGenerator(BaseGenerator):
 
     def __init__(self, config: Config | None = None) -> None:
         super().__init__(config=config)
-        self.template = Template(self._get_template())
+        self.template = get_template("pydantic_model", self._get_template())
         #: Set of enum names that have been extracted to ``_enums.py``.
         #: Populated by ``get_extra_files()`` before ``generate_file()``
         #: is called so that per-schema files can import instead of
@@ -186,7 +185,7 @@ class PydanticGenerator(BaseGenerator):
             # Enum classes now come from _enums, so only import models
             base_class = schema.name
             variant_classes = [
-                self._variant_to_class_name(schema.name, v) for v in schema.variants
+                schema.get_variant_class_name(v) for v in schema.variants
             ]
             model_classes = [base_class] + variant_classes
             lines.append(
@@ -198,7 +197,7 @@ class PydanticGenerator(BaseGenerator):
         for schema in schemas:
             base_class = schema.name
             variant_classes = [
-                self._variant_to_class_name(schema.name, v) for v in schema.variants
+                schema.get_variant_class_name(v) for v in schema.variants
             ]
             all_names.extend([base_class] + variant_classes)
 
@@ -224,7 +223,7 @@ class PydanticGenerator(BaseGenerator):
         # Determine the model name
         model_name = schema.name
         if variant:
-            model_name = self._variant_to_class_name(schema.name, variant)
+            model_name = schema.get_variant_class_name(variant)
 
         # Generate field definitions
         field_definitions = []
@@ -319,7 +318,7 @@ class PydanticGenerator(BaseGenerator):
                 variant_field_defs.append(field_def)
                 all_imports.update(field_imports)
 
-            variant_model_name = self._variant_to_class_name(schema.name, variant_name)
+            variant_model_name = schema.get_variant_class_name(variant_name)
             variant_model = self._generate_single_model(
                 variant_model_name,
                 schema.description,
@@ -342,13 +341,6 @@ class PydanticGenerator(BaseGenerator):
             self_ref_model=schema.name if has_self_ref else None,
         )
 
-    def _variant_to_class_name(self, schema_name: str, variant_name: str) -> str:
-        """Convert variant name to PascalCase class name"""
-        # Convert snake_case to PascalCase
-        parts = variant_name.split("_")
-        variant_pascal = "".join(word.capitalize() for word in parts)
-        return f"{schema_name}{variant_pascal}"
-
     def _generate_field_definition(self, field: USRField) -> tuple[str, set[str]]:
         """Generate a single field definition
 
@@ -1,13 +1,24 @@
 """Generator to create SQLAlchemy 2.0 models from USR schemas"""
 
+import functools
+import re
 from enum import Enum
 from pathlib import Path
 
-from jinja2 import Template
-
 from ..core.usr import FieldType, USRField, USRSchema
+from ._jinja_env import get_template
 from .base import BaseGenerator
 
+_CAMEL_WORD_RE = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
+
+
+@functools.lru_cache(maxsize=256)
+def _to_snake_case(name: str) -> str:
+    """Convert PascalCase to snake_case"""
+    s1 = _CAMEL_WORD_RE.sub(r"\1_\2", name)
+    return _CAMEL_BOUNDARY_RE.sub(r"\1_\2", s1).lower()
+
 
 def _format_class_docstring(docstring: str, indent: str = "    ") -> list[str]:
     '''Render ``docstring`` as the body lines of a Python class docstring.
@@ -28,11 +39,107 @@ def _format_class_docstring(docstring: str, indent: str = "    ") -> list[str]:
     return out
 
 
+# Default value types rendered verbatim in ``mapped_column(default=...)``.
+_LITERAL_DEFAULT_TYPES = frozenset({int, float, bool})
+
+# Every import the column and relationship renderers can record, in sorted
+# order. Lets renders order their imports with set lookups instead of a sort.
+_IMPORT_ORDER = (
+    "datetime.date",
+    "datetime.datetime",
+    "decimal.Decimal",
+    "sqlalchemy.ForeignKey",
+    "sqlalchemy.JSON",
+    "sqlalchemy.Numeric",
+    "sqlalchemy.String",
+    "sqlalchemy.Text",
+    "sqlalchemy.Uuid",
+    "sqlalchemy.func",
+    "sqlalchemy.orm.relationship",
+    "typing.Any",
+    "uuid",
+)
+
+
+def _ordered_imports(imports: set[str]) -> list[str]:
+    """Return ``imports`` in sorted order using the precomputed _IMPORT_ORDER."""
+    ordered = [imp for imp in _IMPORT_ORDER if imp in imports]
+    if len(ordered) != len(imports):
+        # An import outside the known set; fall back to a full sort
+        return sorted(imports)
+    return ordered
+
+
+# Fixed header of every generated model file; ends with the blank line that
+# separates it from the imports.
+_FILE_HEADER = '''"""
+AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
+Generated from: {schema_name}
+Generator: schema-gen SQLAlchemy generator
+
+To regenerate this file, run:
+    schema-gen generate --target sqlalchemy
+
+Changes to this file will be overwritten.
+"""
+'''
+
+# Imports required by the mapped Python types that are not builtins.
+_PYTHON_TYPE_IMPORTS: dict[str, str] = {
+    "datetime": "datetime.datetime",
+    "date": "datetime.date",
+    "uuid.UUID": "uuid",
+    "Decimal": "decimal.Decimal",
+    "Any": "typing.Any",
+}
+
+# Field types whose column mapping does not depend on the field's settings:
+# (sql_type_str_or_None, mapped_python_type, required_import_or_None).
+_SIMPLE_TYPES: dict[FieldType, tuple[str | None, str, str | None]] = {
+    FieldType.INTEGER: (None, "int", None),
+    FieldType.FLOAT: (None, "float", None),
+    FieldType.BOOLEAN: (None, "bool", None),
+    FieldType.DATETIME: (None, "datetime", "datetime.datetime"),
+    FieldType.DATE: (None, "date", "datetime.date"),
+    FieldType.UUID: ("Uuid", "uuid.UUID", "sqlalchemy.Uuid"),
+    FieldType.SET: ("JSON", "Any", "sqlalchemy.JSON"),
+    FieldType.FROZENSET: ("JSON", "Any", "sqlalchemy.JSON"),
+    FieldType.TUPLE: ("JSON", "Any", "sqlalchemy.JSON"),
+    FieldType.JSON: ("JSON", "Any", "sqlalchemy.JSON"),
+}
+
+
+def _sqlalchemy_names(imports: set[str]) -> list[str]:
+    """Names to import from the top-level ``sqlalchemy`` package, in order.
+
+    ``sqlalchemy.orm`` names are excluded; generated files import those
+    with a fixed ``from sqlalchemy.orm import ...`` line.
+    """
+    return [
+        imp.removeprefix("sqlalchemy.")
+        for imp in _ordered_imports(imports)
+        if imp.startswith("sqlalchemy.") and not imp.startswith("sqlalchemy.orm")
+    ]
+
+
+def _schema_docstring_lines(schema: USRSchema) -> list[str]:
+    """Pre-format the class docstring for the model template.
+
+    The lines are indented so the template can drop them in as the first
+    statement of the class body (PEP 257 form). Empty list when there is
+    no description.
+    """
+    return _format_class_docstring(schema.description) if schema.description else []
+
+
 class SqlAlchemyGenerator(BaseGenerator):
     """Generates SQLAlchemy 2.0 models from USR schemas"""
 
     def __init__(self):
-        self.template = Template(self._get_template())
+        self.template = get_template("sqlalchemy_model", self._get_template())
+        self.simple_template = get_template(
+            "sqlalchemy_model_simple", self._get_simple_template()
+        )
 
     @property
     def file_extension(self) -> str:
@@ -47,17 +154,17 @@ class SqlAlchemyGenerator(BaseGenerator):
 
     def generate_index(self, schemas: list[USRSchema], output_dir: Path) -> str | None:
         """Generate __init__.py content for the sqlalchemy package."""
-        lines = ['"""Generated SQLAlchemy models"""\n']
-        lines.append("from ._base import Base")
+        lines = ['"""Generated SQLAlchemy models"""\n', "from ._base import Base"]
+        exports = ["\n__all__ = [", '    "Base",']
 
+        # Import lines and __all__ entries come from the same pass
         for schema in schemas:
-            lines.append(f"from .{schema.name.lower()}_models import {schema.name}")
+            name = schema.name
+            lines.append(f"from .{name.lower()}_models import {name}")
+            exports.append(f'    "{name}",')
 
-        lines.append("\n__all__ = [")
-        lines.append('    "Base",')
-        for schema in schemas:
-            lines.append(f'    "{schema.name}",')
-        lines.append("]")
+        exports.append("]")
+        lines.extend(exports)
 
         return "\n".join(lines) + "\n"
 
@@ -83,45 +190,63 @@ class SqlAlchemyGenerator(BaseGenerator):
         Returns:
             Generated SQLAlchemy model code
         """
+        return self._render_model(schema, variant, _schema_docstring_lines(schema))
+
+    def generate_all_variants(self, schema: USRSchema) -> dict[str, str]:
+        """Generate all variants for a schema
+
+        Args:
+            schema: USR schema to generate variants for
+
+        Returns:
+            Dictionary mapping variant names to generated code
+        """
+        # The class docstring is identical for every variant; format it once
+        docstring_lines = _schema_docstring_lines(schema)
+
+        variants = {}
+
+        # Generate base model (all fields)
+        variants["base"] = self._render_model(schema, None, docstring_lines)
+
+        # Generate specific variants
+        for variant_name in schema.variants:
+            variants[variant_name] = self._render_model(
+                schema, variant_name, docstring_lines
+            )
+
+        return variants
+
+    def _render_model(
+        self, schema: USRSchema, variant: str | None, docstring_lines: list[str]
+    ) -> str:
+        """Render the model template for one variant of a schema"""
         fields = schema.get_variant_fields(variant) if variant else schema.fields
 
         # Determine the model name and table name
         model_name = schema.name
-        table_name = self._to_snake_case(schema.name)
+        table_name = _to_snake_case(schema.name)
 
         if variant:
-            model_name = self._variant_to_class_name(schema.name, variant)
+            model_name = schema.get_variant_class_name(variant)
             table_name = f"{table_name}_{variant}"
 
-        # Generate column definitions
-        column_definitions = []
-        imports = {"sqlalchemy"}
-        relationships = []
+        column_definitions, relationships, imports = self._generate_members(fields)
 
-        for field in fields:
-            if field.relationship:
-                rel_def, rel_imports = self._generate_relationship_definition(field)
-                relationships.append(rel_def)
-                imports.update(rel_imports)
-            else:
-                col_def, col_imports = self._generate_column_definition(field)
-                column_definitions.append(col_def)
-                imports.update(col_imports)
-
-        # Pre-format the class docstring as a list of indented lines so the
-        # template can drop them in as the first statement of the class body
-        # (PEP 257 form). Empty list when there is no description.
-        docstring_lines = (
-            _format_class_docstring(schema.description) if schema.description else []
-        )
+        # Base models without relationships (the common case) skip the
+        # variant and relationship branches of the full template
+        if variant is None and not relationships:
+            template = self.simple_template
+        else:
+            template = self.template
 
-        return self.template.render(
+        return template.render(
             model_name=model_name,
             table_name=table_name,
             schema_name=schema.name,
             variant_name=variant,
             docstring_lines=docstring_lines,
-            imports=sorted(imports),
+            sa_imports=_sqlalchemy_names(imports),
             columns=column_definitions,
             relationships=relationships,
         )
@@ -135,38 +260,58 @@ class SqlAlchemyGenerator(BaseGenerator):
         Returns:
             Complete file content with model
         """
-        all_imports = {"sqlalchemy", "sqlalchemy.orm"}
-        all_columns = []
-        all_relationships = []
-
-        # Generate base model
-        base_fields = schema.fields
-        for field in base_fields:
-            if field.relationship:
-                rel_def, rel_imports = self._generate_relationship_definition(field)
-                all_relationships.append(rel_def)
-                all_imports.update(rel_imports)
-            else:
-                col_def, col_imports = self._generate_column_definition(field)
-                all_columns.append(col_def)
-                all_imports.update(col_imports)
+        columns, relationships, imports = self._generate_members(schema.fields)
 
-        # Generate complete file
         return self._generate_complete_file(
-            schema.name, all_imports, all_columns, all_relationships, schema.description
+            schema.name, imports, columns, relationships, schema.description
         )
 
-    def _generate_column_definition(self, field: USRField) -> tuple[str, set[str]]:
-        """Generate a single column definition using SQLAlchemy 2.0 Mapped[] style
+    def _generate_members(
+        self, fields: list[USRField]
+    ) -> tuple[list[str], list[str], set[str]]:
+        """Render the column and relationship lines of a model
+
+        Shared by generate_model (template path) and generate_file (which
+        imports the shared ``Base`` from ``_base.py`` instead of declaring one).
 
         Returns:
-            Tuple of (column_definition_code, required_imports)
+            Tuple of (column_definitions, relationship_definitions, imports)
         """
+        columns = []
+        relationships = []
         imports = set()
 
+        # Single pass over the fields; every field records its imports
+        # straight into the shared set. Bound methods are hoisted out of
+        # the loop since this runs once per field of every model.
+        add_column = columns.append
+        add_relationship = relationships.append
+        render_column = self._generate_column_definition
+        render_relationship = self._generate_relationship_definition
+
+        for field in fields:
+            if field.relationship:
+                add_relationship(render_relationship(field, imports))
+            else:
+                add_column(render_column(field, imports))
+
+        return columns, relationships, imports
+
+    def _generate_column_definition(self, field: USRField, imports: set) -> str:
+        """Generate a single column definition using SQLAlchemy 2.0 Mapped[] style
+
+        Required imports are added to ``imports``.
+
+        Returns:
+            Column definition code
+        """
         # Get SQLAlchemy type info: (sql_type_str_or_None, python_type)
         sql_type, python_type = self._get_sqlalchemy_type(field, imports)
 
+        python_import = _PYTHON_TYPE_IMPORTS.get(python_type)
+        if python_import:
+            imports.add(python_import)
+
         # Determine Mapped type annotation
         if field.optional and not field.primary_key:
             mapped_type = f"Mapped[{python_type} | None]"
@@ -175,68 +320,75 @@ class SqlAlchemyGenerator(BaseGenerator):
 
         # Build mapped_column parameters
         column_params = []
+        add_param = column_params.append
 
         # SQL type goes first if explicitly needed
         if sql_type:
-            column_params.append(sql_type)
+            add_param(sql_type)
 
         # Primary key
         if field.primary_key:
-            column_params.append("primary_key=True")
+            add_param("primary_key=True")
 
         # (nullable is implicit from Mapped[T] vs Mapped[T | None], so we skip it)
 
         # Unique constraint
         if field.unique:
-            column_params.append("unique=True")
+            add_param("unique=True")
 
         # Index
         if field.index:
-            column_params.append("index=True")
+            add_param("index=True")
 
         # Auto increment
         if field.auto_increment:
-            column_params.append("autoincrement=True")
-
-        # Default value
-        if field.default is not None:
-            if isinstance(field.default, Enum):
-                column_params.append(f'default="{field.default.value}"')
-            elif isinstance(field.default, str):
-                column_params.append(f'default="{field.default}"')
+            add_param("autoincrement=True")
+
+        # Default value. Plain numbers and bools (the common case) are matched
+        # on their exact type; Enum members and strings are rendered quoted.
+        default = field.default
+        if default is not None:
+            if type(default) in _LITERAL_DEFAULT_TYPES:
+                add_param(f"default={default}")
+            elif isinstance(default, Enum):
+                add_param(f'default="{default.value}"')
+            elif isinstance(default, str):
+                add_param(f'default="{default}"')
             else:
-                column_params.append(f"default={field.default}")
+                add_param(f"default={default}")
 
         # Foreign key
         if field.foreign_key:
-            column_params.append(f'ForeignKey("{field.foreign_key}")')
+            add_param(f'ForeignKey("{field.foreign_key}")')
             imports.add("sqlalchemy.ForeignKey")
 
         # Server defaults for timestamps
         if field.auto_now_add:
             imports.add("sqlalchemy.func")
-            column_params.append("server_default=func.now()")
+            add_param("server_default=func.now()")
 
         if field.auto_now:
             imports.add("sqlalchemy.func")
-            column_params.append("server_default=func.now()")
-            column_params.append("onupdate=func.now()")
+            add_param("server_default=func.now()")
+            add_param("onupdate=func.now()")
 
-        # Build column definition
-        params_str = ", ".join(column_params) if column_params else ""
-        column_def = f"    {field.name}: {mapped_type} = mapped_column({params_str})"
+        # Build column definition in one pass; an empty list joins to ""
+        column_def = (
+            f"    {field.name}: {mapped_type} = "
+            f"mapped_column({', '.join(column_params)})"
+        )
 
-        return column_def, imports
+        return column_def
 
-    def _generate_relationship_definition(
-        self, field: USRField
-    ) -> tuple[str, set[str]]:
+    def _generate_relationship_definition(self, field: USRField, imports: set) -> str:
         """Generate a relationship definition
 
+        Required imports are added to ``imports``.
+
         Returns:
-            Tuple of (relationship_definition_code, required_imports)
+            Relationship definition code
         """
-        imports = {"sqlalchemy.orm.relationship"}
+        imports.add("sqlalchemy.orm.relationship")
 
         rel_params = []
         rel_params.append(f'"{field.nested_schema}"')
@@ -249,7 +401,7 @@ class SqlAlchemyGenerator(BaseGenerator):
 
         relationship_def = f"    {field.name} = relationship({', '.join(rel_params)})"
 
-        return relationship_def, imports
+        return relationship_def
 
     def _get_sqlalchemy_type(
         self, field: USRField, imports: set
@@ -259,7 +411,16 @@ class SqlAlchemyGenerator(BaseGenerator):
         Returns:
             Tuple of (sql_type_str_or_None, mapped_python_type).
             When sql_type is None, mapped_column() infers the SQL type from Mapped[T].
+
+        Types listed in ``_SIMPLE_TYPES`` resolve with a single lookup; only
+        types whose mapping depends on field settings reach the branches below.
         """
+        simple = _SIMPLE_TYPES.get(field.type)
+        if simple is not None:
+            sql_type, python_type, required_import = simple
+            if required_import:
+                imports.add(required_import)
+            return sql_type, python_type
 
         if field.type == FieldType.STRING:
             if field.max_length:
@@ -269,41 +430,12 @@ class SqlAlchemyGenerator(BaseGenerator):
                 imports.add("sqlalchemy.Text")
                 return "Text", "str"
 
-        elif field.type == FieldType.INTEGER:
-            return None, "int"
-
-        elif field.type == FieldType.FLOAT:
-            return None, "float"
-
-        elif field.type == FieldType.BOOLEAN:
-            return None, "bool"
-
-        elif field.type == FieldType.DATETIME:
-            imports.add("datetime.datetime")
-            return None, "datetime"
-
-        elif field.type == FieldType.DATE:
-            imports.add("datetime.date")
-            return None, "date"
-
-        elif field.type == FieldType.UUID:
-            imports.add("sqlalchemy.Uuid")
-            return "Uuid", "uuid.UUID"
-
         elif field.type == FieldType.DECIMAL:
             imports.add("sqlalchemy.Numeric")
             precision = field.target_config.get("sqlalchemy", {}).get("precision", 10)
             scale = field.target_config.get("sqlalchemy", {}).get("scale", 2)
             return f"Numeric({precision}, {scale})", "Decimal"
 
-        elif (
-            field.type in (FieldType.SET, FieldType.FROZENSET)
-            or field.type == FieldType.TUPLE
-            or field.type == FieldType.JSON
-        ):
-            imports.add("sqlalchemy.JSON")
-            return "JSON", "Any"
-
         elif field.type == FieldType.ENUM:
             # Use String with length based on max enum value length
             imports.add("sqlalchemy.String")
@@ -317,19 +449,6 @@ class SqlAlchemyGenerator(BaseGenerator):
             imports.add("sqlalchemy.String")
             return "String(255)", "str"
 
-    def _variant_to_class_name(self, schema_name: str, variant_name: str) -> str:
-        """Convert variant name to PascalCase class name"""
-        parts = variant_name.split("_")
-        variant_pascal = "".join(word.capitalize() for word in parts)
-        return f"{schema_name}{variant_pascal}"
-
-    def _to_snake_case(self, name: str) -> str:
-        """Convert PascalCase to snake_case"""
-        import re
-
-        s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-        return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
-
     def _generate_complete_file(
         self,
         schema_name: str,
@@ -339,121 +458,54 @@ class SqlAlchemyGenerator(BaseGenerator):
         description: str,
     ) -> str:
         """Generate complete file with header, imports, and model"""
-        lines = [
-            '"""',
-            "AUTO-GENERATED FILE - DO NOT EDIT MANUALLY",
-            f"Generated from: {schema_name}",
-            "Generator: schema-gen SQLAlchemy generator",
-            "",
-            "To regenerate this file, run:",
-            "    schema-gen generate --target sqlalchemy",
-            "",
-            "Changes to this file will be overwritten.",
-            '"""',
-            "",
-        ]
-
-        # Collect stdlib imports needed
-        needs_datetime = False
-        needs_date = False
-        needs_uuid = False
-        needs_decimal = False
-        needs_any = False
-
-        for imp in imports:
-            if imp == "datetime.datetime":
-                needs_datetime = True
-            elif imp == "datetime.date":
-                needs_date = True
-
-        # Also scan columns for type hints
-        for col in columns:
-            if "uuid.UUID" in col:
-                needs_uuid = True
-            if "Decimal" in col:
-                needs_decimal = True
-            if "Any" in col:
-                needs_any = True
-            if "datetime" in col and "Mapped[datetime" in col:
-                needs_datetime = True
-            if "Mapped[date" in col and "Mapped[datetime" not in col:
-                needs_date = True
-
-        # Add stdlib imports
-        datetime_parts = []
-        if needs_datetime:
-            datetime_parts.append("datetime")
-        if needs_date:
-            datetime_parts.append("date")
-        if datetime_parts:
-            lines.append(f"from datetime import {', '.join(sorted(datetime_parts))}")
-        if needs_decimal:
+        lines = [_FILE_HEADER.format(schema_name=schema_name)]
+
+        # Add stdlib imports for the mapped Python types
+        datetime_names = sorted(
+            imp.removeprefix("datetime.")
+            for imp in imports
+            if imp.startswith("datetime.")
+        )
+        if datetime_names:
+            lines.append(f"from datetime import {', '.join(datetime_names)}")
+        if "decimal.Decimal" in imports:
             lines.append("from decimal import Decimal")
-        if needs_uuid:
+        if "uuid" in imports:
             lines.append("import uuid")
-        if needs_any:
+        if "typing.Any" in imports:
             lines.append("from typing import Any")
 
-        # Build needed SQLAlchemy type imports (only types explicitly used in mapped_column)
-        sa_type_imports = set()
-        for col in columns:
-            for type_name in [
-                "String",
-                "Text",
-                "Numeric",
-                "JSON",
-                "Uuid",
-            ]:
-                if (
-                    type_name + "(" in col
-                    or type_name + ")" in col
-                    or type_name + "," in col
-                ):
-                    sa_type_imports.add(type_name)
-                # Also catch bare type_name at the end of mapped_column params
-                if f"mapped_column({type_name})" in col:
-                    sa_type_imports.add(type_name)
-
-        # Add func if used
-        needs_func = any("func.now()" in col for col in columns)
-        if needs_func:
-            sa_type_imports.add("func")
-
-        # Add ForeignKey if used
-        for imp in sorted(imports):
-            if imp == "sqlalchemy.ForeignKey":
-                sa_type_imports.add("ForeignKey")
-
-        if sa_type_imports:
-            lines.append(f"from sqlalchemy import {', '.join(sorted(sa_type_imports))}")
-        lines.append("from sqlalchemy.orm import Mapped, mapped_column, relationship")
-
-        lines.append("from ._base import Base")
-        lines.append("")
-        lines.append("")
+        # SQLAlchemy names actually used in mapped_column() calls
+        sa_names = _sqlalchemy_names(imports)
+        if sa_names:
+            lines.append(f"from sqlalchemy import {', '.join(sa_names)}")
+        lines.extend(
+            (
+                "from sqlalchemy.orm import Mapped, mapped_column, relationship",
+                "from ._base import Base",
+                "",
+                "",
+            )
+        )
 
         # Add model class. The class docstring must be the FIRST statement
         # in the class body — emitting it after ``__tablename__`` makes it a
         # no-op string expression and ``ClassName.__doc__`` ends up ``None``.
-        table_name = self._to_snake_case(schema_name)
+        table_name = _to_snake_case(schema_name)
         lines.append(f"class {schema_name}(Base):")
 
         if description:
             lines.extend(_format_class_docstring(description))
 
-        lines.append(f'    __tablename__ = "{table_name}"')
-        lines.append("")
+        lines.extend((f'    __tablename__ = "{table_name}"', ""))
 
         # Add columns
-        for column in columns:
-            lines.append(column)
+        lines.extend(columns)
 
         # Add relationships
         if relationships:
-            lines.append("")
-            lines.append("    # Relationships")
-            for relationship in relationships:
-                lines.append(relationship)
+            lines.extend(("", "    # Relationships"))
+            lines.extend(relationships)
 
         return "\n".join(lines)
 
@@ -471,10 +523,8 @@ Changes to this file will be overwritten.
 """
 
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-{% for imp in imports %}
-{%- if imp.startswith('sqlalchemy.') and imp != 'sqlalchemy' and imp != 'sqlalchemy.orm' %}
-from sqlalchemy import {{ imp.replace('sqlalchemy.', '') }}
-{%- endif %}
+{% for name in sa_imports %}
+from sqlalchemy import {{ name }}
 {%- endfor %}
 
 
@@ -498,3 +548,40 @@ class {{ model_name }}(Base):
 {{ rel_def }}
 {%- endfor %}
 {%- endif %}'''
+
+    def _get_simple_template(self) -> str:
+        """Get the Jinja2 template for base models without relationships
+
+        Renders exactly what ``_get_template`` renders when there is no
+        variant and no relationships, without evaluating those branches.
+        """
+        return '''"""
+AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
+Generated from: {{ schema_name }}
+Generator: schema-gen SQLAlchemy generator
+
+To regenerate this file, run:
+    schema-gen generate --target sqlalchemy
+
+Changes to this file will be overwritten.
+"""
+
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+{% for name in sa_imports %}
+from sqlalchemy import {{ name }}
+{%- endfor %}
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class {{ model_name }}(Base):
+{%- for doc_line in docstring_lines %}
+{{ doc_line }}
+{%- endfor %}
+    __tablename__ = "{{ table_name }}"
+
+{% for column_def in columns %}
+{{ column_def }}
+{%- endfor %}'''
@@ -1,19 +1,51 @@
 """Generator to create Python TypedDict from USR schemas"""
 
+import io
+from collections.abc import Iterable
 from pathlib import Path
-
-from jinja2 import Template
+from typing import IO
 
 from ..core.usr import FieldType, USRField, USRSchema
 from .base import BaseGenerator
 
+# Field types whose annotation never depends on field settings:
+# (annotation, required_import_or_None). Enum values are typed as strings.
+_SIMPLE_PYTHON_TYPES: dict[FieldType, tuple[str, str | None]] = {
+    FieldType.STRING: ("str", None),
+    FieldType.INTEGER: ("int", None),
+    FieldType.FLOAT: ("float", None),
+    FieldType.BOOLEAN: ("bool", None),
+    FieldType.DATETIME: ("datetime.datetime", "datetime"),
+    FieldType.DATE: ("datetime.date", "datetime"),
+    FieldType.UUID: ("uuid.UUID", "uuid"),
+    FieldType.DECIMAL: ("decimal.Decimal", "decimal"),
+    FieldType.ENUM: ("str", None),
+}
+
+_FILE_HEADER = '''"""
+AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
+Generated from: {schema_name}
+Generator: schema-gen TypedDict generator
+
+To regenerate this file, run:
+    schema-gen generate --target typeddict
+
+Changes to this file will be overwritten.
+"""
+
+from typing_extensions import TypedDict, NotRequired'''
+
+# Import line for each module-qualified annotation, in emission order
+_IMPORT_LINES: dict[str, str] = {
+    "datetime": "import datetime",
+    "decimal": "import decimal",
+    "uuid": "import uuid",
+}
+
 
 class TypedDictGenerator(BaseGenerator):
     """Generates Python TypedDict definitions from USR schemas"""
 
-    def __init__(self):
-        self.template = Template(self._get_template())
-
     @property
     def file_extension(self) -> str:
         return ".py"
@@ -32,7 +64,7 @@ class TypedDictGenerator(BaseGenerator):
         for schema in schemas:
             base_class = schema.name
             variant_classes = [
-                self._variant_to_class_name(schema.name, v) for v in schema.variants
+                schema.get_variant_class_name(v) for v in schema.variants
             ]
             all_classes = [base_class] + variant_classes
             lines.append(
@@ -43,7 +75,7 @@ class TypedDictGenerator(BaseGenerator):
         for schema in schemas:
             base_class = schema.name
             variant_classes = [
-                self._variant_to_class_name(schema.name, v) for v in schema.variants
+                schema.get_variant_class_name(v) for v in schema.variants
             ]
             all_classes = [f'"{c}"' for c in [base_class] + variant_classes]
             lines.append(f"    {', '.join(all_classes)},")
@@ -66,31 +98,26 @@ class TypedDictGenerator(BaseGenerator):
         # Determine the class name
         class_name = schema.name
         if variant:
-            class_name = self._variant_to_class_name(schema.name, variant)
+            class_name = schema.get_variant_class_name(variant)
 
         # Generate field definitions
-        field_definitions = []
         imports = {"typing_extensions"}
+        field_definitions = [
+            self._generate_field_definition(field, imports) for field in fields
+        ]
 
-        # Determine if we need total=False (for optional fields)
-        has_optional_fields = any(
-            field.optional or field.default is not None for field in fields
+        typeddict = self._generate_single_typeddict(
+            class_name,
+            schema.description,
+            field_definitions,
+            is_base_class=variant is None,
         )
 
-        for field in fields:
-            field_def, field_imports = self._generate_field_definition(field)
-            field_definitions.append(field_def)
-            imports.update(field_imports)
-
-        return self.template.render(
-            class_name=class_name,
-            schema_name=schema.name,
-            variant_name=variant,
-            description=schema.description,
-            imports=sorted(imports),
-            fields=field_definitions,
-            has_optional_fields=has_optional_fields,
-        )
+        # Same assembly as generate_file, with the variant named in the header
+        header_name = f"{schema.name} ({variant} variant)" if variant else schema.name
+        buf = io.StringIO()
+        self._generate_complete_file(header_name, imports, [typeddict], buf)
+        return buf.getvalue()
 
     def generate_file(self, schema: USRSchema) -> str:
         """Generate a complete file with all TypedDict variants
@@ -101,64 +128,72 @@ class TypedDictGenerator(BaseGenerator):
         Returns:
             Complete file content with all TypedDicts
         """
-        all_imports = {"typing_extensions"}
-        all_typeddicts = []
+        buf = io.StringIO()
+        self.generate_file_to(schema, buf)
+        return buf.getvalue()
 
-        # Generate base TypedDict
-        base_fields = schema.fields
-        base_field_defs = []
-        base_has_optional = any(
-            field.optional or field.default is not None for field in base_fields
-        )
+    def generate_file_to(self, schema: USRSchema, out: IO[str]) -> None:
+        """Stream a complete file with all TypedDict variants to ``out``
 
-        for field in base_fields:
-            field_def, field_imports = self._generate_field_definition(field)
-            base_field_defs.append(field_def)
-            all_imports.update(field_imports)
+        Field definitions for every class are resolved first so the import
+        block is known up front; each TypedDict body is then rendered and
+        written one at a time.
 
-        base_typeddict = self._generate_single_typeddict(
-            schema.name,
-            schema.description,
-            base_field_defs,
-            base_has_optional,
-            is_base_class=True,
-        )
-        all_typeddicts.append(base_typeddict)
+        Args:
+            schema: USR schema to generate from
+            out: Writable text stream
+        """
+        all_imports = {"typing_extensions"}
+        # Variants reuse the base schema's USRField objects, so each field
+        # is rendered once and its definition reused; ids stay unique while
+        # the schema holds the fields.
+        rendered: dict[int, str] = {}
+
+        def class_fields(fields: list[USRField]) -> list[str]:
+            field_defs = []
+            for field in fields:
+                field_def = rendered.get(id(field))
+                if field_def is None:
+                    field_def = self._generate_field_definition(field, all_imports)
+                    rendered[id(field)] = field_def
+                field_defs.append(field_def)
+            return field_defs
+
+        # (class_name, field_defs, is_base_class)
+        all_classes = [(schema.name, class_fields(schema.fields), True)]
 
         # Generate variants
         for variant_name in schema.variants:
-            variant_fields = schema.get_variant_fields(variant_name)
-            variant_field_defs = []
-            variant_has_optional = any(
-                field.optional or field.default is not None for field in variant_fields
+            variant_class_name = schema.get_variant_class_name(variant_name)
+            all_classes.append(
+                (
+                    variant_class_name,
+                    class_fields(schema.get_variant_fields(variant_name)),
+                    False,
+                )
             )
 
-            for field in variant_fields:
-                field_def, field_imports = self._generate_field_definition(field)
-                variant_field_defs.append(field_def)
-                all_imports.update(field_imports)
-
-            variant_class_name = self._variant_to_class_name(schema.name, variant_name)
-            variant_typeddict = self._generate_single_typeddict(
-                variant_class_name,
+        typeddicts = (
+            self._generate_single_typeddict(
+                class_name,
                 schema.description,
-                variant_field_defs,
-                variant_has_optional,
-                is_base_class=False,
+                field_defs,
+                is_base_class=is_base,
             )
-            all_typeddicts.append(variant_typeddict)
+            for class_name, field_defs, is_base in all_classes
+        )
 
         # Generate complete file
-        return self._generate_complete_file(schema.name, all_imports, all_typeddicts)
+        self._generate_complete_file(schema.name, all_imports, typeddicts, out)
 
-    def _generate_field_definition(self, field: USRField) -> tuple[str, set[str]]:
+    def _generate_field_definition(self, field: USRField, imports: set) -> str:
         """Generate a single field definition
 
+        Imports required by the field's annotation are added to ``imports``.
+
         Returns:
-            Tuple of (field_definition_code, required_imports)
+            Field definition code
         """
-        imports = set()
-
         # Get Python type annotation
         type_annotation = self._get_python_type(field, imports)
 
@@ -169,40 +204,16 @@ class TypedDictGenerator(BaseGenerator):
         if field.description:
             field_def += f"  # {field.description}"
 
-        return field_def, imports
+        return field_def
 
     def _get_python_type(self, field: USRField, imports: set) -> str:
         """Get the Python type annotation for a field"""
 
-        base_type = ""
-
-        if field.type == FieldType.STRING:
-            base_type = "str"
-
-        elif field.type == FieldType.INTEGER:
-            base_type = "int"
-
-        elif field.type == FieldType.FLOAT:
-            base_type = "float"
-
-        elif field.type == FieldType.BOOLEAN:
-            base_type = "bool"
-
-        elif field.type == FieldType.DATETIME:
-            imports.add("datetime")
-            base_type = "datetime.datetime"
-
-        elif field.type == FieldType.DATE:
-            imports.add("datetime")
-            base_type = "datetime.date"
-
-        elif field.type == FieldType.UUID:
-            imports.add("uuid")
-            base_type = "uuid.UUID"
-
-        elif field.type == FieldType.DECIMAL:
-            imports.add("decimal")
-            base_type = "decimal.Decimal"
+        simple = _SIMPLE_PYTHON_TYPES.get(field.type)
+        if simple is not None:
+            base_type, required_import = simple
+            if required_import:
+                imports.add(required_import)
 
         elif field.type == FieldType.LIST:
             if field.inner_type:
@@ -262,9 +273,6 @@ class TypedDictGenerator(BaseGenerator):
             else:
                 base_type = "str"
 
-        elif field.type == FieldType.ENUM:
-            base_type = "str"  # Enum values as strings
-
         elif field.type == FieldType.NESTED_SCHEMA:
             # For nested schemas, use forward reference
             base_type = f'"{field.nested_schema}"'
@@ -280,133 +288,54 @@ class TypedDictGenerator(BaseGenerator):
 
         return base_type
 
-    def _variant_to_class_name(self, schema_name: str, variant_name: str) -> str:
-        """Convert variant name to PascalCase class name"""
-        parts = variant_name.split("_")
-        variant_pascal = "".join(word.capitalize() for word in parts)
-        return f"{schema_name}{variant_pascal}"
-
     def _generate_single_typeddict(
         self,
         class_name: str,
         description: str,
         field_defs: list[str],
-        has_optional_fields: bool,
         is_base_class: bool = False,
-    ) -> str:
-        """Generate a single TypedDict definition"""
-        lines = []
-
+    ) -> list[str]:
+        """Generate the lines of a single TypedDict definition"""
         # Always use TypedDict without total=False; optional fields use NotRequired[]
-        lines.append(f"class {class_name}(TypedDict):")
+        lines = [f"class {class_name}(TypedDict):"]
 
         if description:
-            lines.append('    """')
-            lines.append(f"    {description}")
-            lines.append('    """')
+            lines += ('    """', f"    {description}", '    """')
 
         # Add fields
-        for field_def in field_defs:
-            lines.append(field_def)
+        lines += field_defs
 
         if not field_defs:
             lines.append("    pass")
 
-        return "\n".join(lines)
+        return lines
 
     def _generate_complete_file(
-        self, schema_name: str, imports: set, typeddicts: list[str]
-    ) -> str:
-        """Generate complete file with header, imports, and all TypedDicts"""
-        lines = [
-            '"""',
-            "AUTO-GENERATED FILE - DO NOT EDIT MANUALLY",
-            f"Generated from: {schema_name}",
-            "Generator: schema-gen TypedDict generator",
-            "",
-            "To regenerate this file, run:",
-            "    schema-gen generate --target typeddict",
-            "",
-            "Changes to this file will be overwritten.",
-            '"""',
-            "",
-        ]
-
-        # Add imports
-        lines.append("from typing_extensions import TypedDict, NotRequired")
-
-        # Add typing imports
-        typing_imports = []
-        other_imports = []
-
-        for imp in sorted(imports):
-            if imp.startswith("datetime"):
-                other_imports.append("import datetime")
-            elif imp.startswith("uuid"):
-                other_imports.append("import uuid")
-            elif imp.startswith("decimal"):
-                other_imports.append("from decimal import Decimal")
-            elif imp == "typing":
-                typing_imports.extend(["List", "Dict", "Any", "Union", "Literal"])
+        self,
+        schema_name: str,
+        imports: set,
+        typeddicts: Iterable[list[str]],
+        out: IO[str],
+    ) -> None:
+        """Write complete file with header, imports, and all TypedDicts
+
+        Header and import lines are written straight to ``out``; each
+        TypedDict is joined once and written as it is produced.
+        """
+        write = out.write
+        write(_FILE_HEADER.format(schema_name=schema_name))
 
         # Add typing import if needed
-        if typing_imports:
-            lines.append(f"from typing import {', '.join(sorted(set(typing_imports)))}")
+        if "typing" in imports:
+            write("\nfrom typing import Any, Dict, List, Literal, Union")
 
         # Add other imports
-        for imp_line in set(other_imports):
-            lines.append(imp_line)
-
-        lines.append("")
-        lines.append("")
-
-        # Add TypedDicts
-        for i, typeddict in enumerate(typeddicts):
-            if i > 0:
-                lines.append("")
-                lines.append("")
-            lines.append(typeddict)
-
-        return "\n".join(lines)
-
-    def _get_template(self) -> str:
-        """Get the Jinja2 template for TypedDicts"""
-        return '''"""
-AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
-Generated from: {{ schema_name }}{% if variant_name %} ({{ variant_name }} variant){% endif %}
-Generator: schema-gen TypedDict generator
-
-To regenerate this file, run:
-    schema-gen generate --target typeddict
-
-Changes to this file will be overwritten.
-"""
-
-from typing_extensions import TypedDict, NotRequired
-{% set typing_imports = [] %}
-{% for imp in imports %}
-{%- if imp.startswith('datetime') %}
-import datetime
-{%- elif imp.startswith('uuid') %}
-import uuid
-{%- elif imp.startswith('decimal') %}
-from decimal import Decimal
-{%- elif imp == 'typing' %}
-{% set _ = typing_imports.extend(['List', 'Dict', 'Any', 'Union', 'Literal']) %}
-{%- endif %}
-{%- endfor %}
-{% if typing_imports %}from typing import {{ typing_imports|unique|sort|join(', ') }}{% endif %}
-
-
-class {{ class_name }}(TypedDict):
-{%- if description %}
-    """
-    {{ description }}
-    """
-{%- endif %}
-{% for field_def in fields %}
-{{ field_def }}
-{%- endfor %}
-{%- if not fields %}
-    pass
-{%- endif %}'''
+        for name, line in _IMPORT_LINES.items():
+            if name in imports:
+                write("\n")
+                write(line)
+
+        # Add TypedDicts, separated by two blank lines
+        for typeddict_lines in typeddicts:
+            write("\n\n\n")
+            write("\n".join(typeddict_lines))
@@ -1,11 +1,11 @@
 """Generator to create Zod schemas from USR schemas"""
 
+import io
 import logging
+from collections.abc import Callable
 from enum import Enum
 from pathlib import Path
-from typing import Any
-
-from jinja2 import Template
+from typing import IO, Any
 
 from ..core.config import Config
 from ..core.usr import FieldType, USRField, USRSchema
@@ -17,6 +17,82 @@ logger = logging.getLogger(__name__)
 _SUPPORTED_ZOD_CONFIG_KEYS: frozenset[str] = frozenset({"strict", "coerce"})
 
 
+# Field types whose Zod / TypeScript type never depends on field settings
+# or config.
+_SIMPLE_ZOD_TYPES: dict[FieldType, str] = {
+    FieldType.STRING: "z.string()",
+    FieldType.INTEGER: "z.number().int()",
+    FieldType.FLOAT: "z.number()",
+    FieldType.BOOLEAN: "z.boolean()",
+    FieldType.UUID: "z.string().uuid()",
+}
+_SIMPLE_TS_TYPES: dict[FieldType, str] = {
+    FieldType.STRING: "string",
+    FieldType.INTEGER: "number",
+    FieldType.FLOAT: "number",
+    FieldType.BOOLEAN: "boolean",
+    FieldType.UUID: "string",
+}
+
+# Temporal types: ISO-string validators, or ``z.coerce.date()`` when
+# ``Config.zod["coerce"]`` is set.
+_TEMPORAL_ZOD_TYPES: dict[FieldType, str] = {
+    FieldType.DATETIME: "z.string().datetime()",
+    FieldType.DATE: "z.string().date()",
+    FieldType.TIME: "z.string().time()",
+}
+
+
+_FILE_HEADER = """/**
+ * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
+ * Generated from: {schema_name}
+ * Generator: schema-gen Zod generator
+ *
+ * To regenerate this file, run:
+ *     schema-gen generate --target zod
+ *
+ * Changes to this file will be overwritten.
+ */
+
+import {{ z }} from 'zod';"""
+
+# String ``format`` values with a dedicated Zod check
+_STRING_FORMAT_CHECKS: dict[str, str] = {
+    "email": ".email()",
+    "url": ".url()",
+    "uuid": ".uuid()",
+}
+
+
+def _string_validations(field: USRField, parts: list[str]) -> None:
+    """Append Zod length, regex and format checks for a string field"""
+    if field.min_length is not None:
+        parts.append(f".min({field.min_length})")
+    if field.max_length is not None:
+        parts.append(f".max({field.max_length})")
+    if field.regex_pattern:
+        parts.append(f".regex(/{field.regex_pattern}/)")
+    format_check = _STRING_FORMAT_CHECKS.get(field.format_type)
+    if format_check is not None:
+        parts.append(format_check)
+
+
+def _numeric_validations(field: USRField, parts: list[str]) -> None:
+    """Append Zod range checks for an integer or float field"""
+    if field.min_value is not None:
+        parts.append(f".min({field.min_value})")
+    if field.max_value is not None:
+        parts.append(f".max({field.max_value})")
+
+
+# Validation builders by field type; other types carry no Zod checks.
+_VALIDATION_BUILDERS: dict[FieldType, Callable[[USRField, list[str]], None]] = {
+    FieldType.STRING: _string_validations,
+    FieldType.INTEGER: _numeric_validations,
+    FieldType.FLOAT: _numeric_validations,
+}
+
+
 def _tag_to_type_name(tag: str) -> str:
     """Convert a tag name like ``toggleable`` to PascalCase type ``ToggleableField``."""
     parts = tag.split("_")
@@ -53,8 +129,10 @@ class ZodGenerator(BaseGenerator):
 
     def __init__(self, config: Config | None = None) -> None:
         super().__init__(config=config)
-        self.template = Template(self._get_template())
         self._self_ref_schema_names: set[str] = set()
+        # Zod types resolved during the current generate call, keyed by
+        # id(field). Each entry keeps its field alive so ids stay unique.
+        self._zod_type_cache: dict[int, tuple[USRField, str]] = {}
         # Warn on unknown Config.zod keys.
         if config is not None:
             zod_cfg: dict[str, Any] = getattr(config, "zod", None) or {}
@@ -121,7 +199,7 @@ class ZodGenerator(BaseGenerator):
                 value_names.append(schema_val)
                 exported_value_names.add(schema_val)
             for v in schema.variants:
-                variant_val = f"{self._variant_to_schema_name(schema.name, v)}Schema"
+                variant_val = f"{schema.get_variant_class_name(v)}Schema"
                 if variant_val not in exported_value_names:
                     value_names.append(variant_val)
                     exported_value_names.add(variant_val)
@@ -136,7 +214,7 @@ class ZodGenerator(BaseGenerator):
                 type_names.append(schema.name)
                 exported_type_names.add(schema.name)
             for v in schema.variants:
-                variant_type = self._variant_to_schema_name(schema.name, v)
+                variant_type = schema.get_variant_class_name(v)
                 if variant_type not in exported_type_names:
                     type_names.append(variant_type)
                     exported_type_names.add(variant_type)
@@ -165,7 +243,13 @@ class ZodGenerator(BaseGenerator):
         # Determine the schema name
         schema_name = schema.name
         if variant:
-            schema_name = self._variant_to_schema_name(schema.name, variant)
+            schema_name = schema.get_variant_class_name(variant)
+
+        # Track self-referencing fields for z.lazy() generation
+        self._self_ref_schema_names = (
+            {schema.name} if schema.get_self_referencing_fields() else set()
+        )
+        self._zod_type_cache.clear()
 
         # Generate field definitions
         field_definitions = []
@@ -174,13 +258,19 @@ class ZodGenerator(BaseGenerator):
             field_def = self._generate_field_definition(field)
             field_definitions.append(field_def)
 
-        return self.template.render(
-            schema_name=schema_name,
-            base_schema_name=schema.name,
-            variant_name=variant,
-            description=schema.description,
-            fields=field_definitions,
+        zod_schema = self._generate_single_schema(
+            schema_name,
+            schema.description,
+            field_definitions,
+            is_base_schema=variant is None,
         )
+        ts_type = self._generate_typescript_type(schema_name, fields)
+
+        # Same assembly as generate_file, with the variant named in the header
+        header_name = f"{schema.name} ({variant} variant)" if variant else schema.name
+        buf = io.StringIO()
+        self._generate_complete_file(header_name, [zod_schema], [ts_type], buf)
+        return buf.getvalue()
 
     def generate_all_variants(self, schema: USRSchema) -> dict[str, str]:
         """Generate all variants for a schema
@@ -211,10 +301,22 @@ class ZodGenerator(BaseGenerator):
         Returns:
             Complete file content with all schemas
         """
+        buf = io.StringIO()
+        self.generate_file_to(schema, buf)
+        return buf.getvalue()
+
+    def generate_file_to(self, schema: USRSchema, out: IO[str]) -> None:
+        """Write a complete TypeScript file with all variants to ``out``
+
+        Args:
+            schema: USR schema to generate from
+            out: Writable text stream
+        """
         # Track self-referencing fields for z.lazy() generation
         self._self_ref_schema_names = (
             {schema.name} if schema.get_self_referencing_fields() else set()
         )
+        self._zod_type_cache.clear()
 
         # Collect cross-schema references so we can emit the right
         # ``import { OtherSchema } from './other';`` lines at the top of
@@ -250,9 +352,7 @@ class ZodGenerator(BaseGenerator):
                 field_def = self._generate_field_definition(field)
                 variant_field_defs.append(field_def)
 
-            variant_schema_name = self._variant_to_schema_name(
-                schema.name, variant_name
-            )
+            variant_schema_name = schema.get_variant_class_name(variant_name)
             variant_schema = self._generate_single_schema(
                 variant_schema_name,
                 schema.description,
@@ -271,10 +371,11 @@ class ZodGenerator(BaseGenerator):
         tag_groups = schema.get_tagged_fields()
 
         # Generate complete file
-        return self._generate_complete_file(
+        self._generate_complete_file(
             schema.name,
             all_schemas,
             all_types,
+            out,
             schema.enums,
             external_refs=external_refs,
             tag_groups=tag_groups,
@@ -286,91 +387,63 @@ class ZodGenerator(BaseGenerator):
         Returns:
             Field definition code
         """
-        # Get base Zod type
-        zod_type = self._get_zod_type(field)
+        parts = ["  ", field.name, ": ", self._get_zod_type(field)]
 
         # Add validation rules
-        validations = []
-
-        if field.type == FieldType.STRING:
-            if field.min_length is not None:
-                validations.append(f".min({field.min_length})")
-            if field.max_length is not None:
-                validations.append(f".max({field.max_length})")
-            if field.regex_pattern:
-                validations.append(f".regex(/{field.regex_pattern}/)")
-            if field.format_type == "email":
-                validations.append(".email()")
-            elif field.format_type == "url":
-                validations.append(".url()")
-            elif field.format_type == "uuid":
-                validations.append(".uuid()")
-
-        elif field.type in [FieldType.INTEGER, FieldType.FLOAT]:
-            if field.min_value is not None:
-                validations.append(f".min({field.min_value})")
-            if field.max_value is not None:
-                validations.append(f".max({field.max_value})")
-
-        # Build complete field definition
-        field_def = f"  {field.name}: {zod_type}{''.join(validations)}"
+        build_validations = _VALIDATION_BUILDERS.get(field.type)
+        if build_validations is not None:
+            build_validations(field, parts)
 
         # Add optional if needed
         if field.optional:
-            field_def += ".optional()"
+            parts.append(".optional()")
 
         # Add default value
-        if field.default is not None:
-            if isinstance(field.default, Enum):
-                field_def += f'.default("{field.default.value}")'
-            elif isinstance(field.default, str):
-                field_def += f'.default("{field.default}")'
+        default = field.default
+        if default is not None:
+            if isinstance(default, Enum):
+                parts.append(f'.default("{default.value}")')
+            elif isinstance(default, str):
+                parts.append(f'.default("{default}")')
+            elif isinstance(default, bool):
+                parts.append(f".default({str(default).lower()})")
             else:
-                field_def += f".default({str(field.default).lower() if isinstance(field.default, bool) else field.default})"
+                parts.append(f".default({default})")
 
         # Add trailing comma (required for valid JS/TS in z.object)
-        field_def += ","
+        parts.append(",")
 
         # Add description as comment
         if field.description:
-            field_def += f" // {field.description}"
+            parts.append(f" // {field.description}")
 
-        return field_def
+        return "".join(parts)
 
     def _get_zod_type(self, field: USRField) -> str:
-        """Get the Zod type for a field"""
-
-        if field.type == FieldType.STRING:
-            return "z.string()"
-
-        elif field.type == FieldType.INTEGER:
-            return "z.number().int()"
-
-        elif field.type == FieldType.FLOAT:
-            return "z.number()"
-
-        elif field.type == FieldType.BOOLEAN:
-            return "z.boolean()"
-
-        elif field.type == FieldType.DATETIME:
-            if self._zod_cfg().get("coerce", False):
-                return "z.coerce.date()"
-            return "z.string().datetime()"
-
-        elif field.type == FieldType.DATE:
-            if self._zod_cfg().get("coerce", False):
-                return "z.coerce.date()"
-            return "z.string().date()"
+        """Get the Zod type for a field
 
-        elif field.type == FieldType.TIME:
+        Fields shared by the base schema and its variants are resolved once
+        per generate call.
+        """
+        cached = self._zod_type_cache.get(id(field))
+        if cached is None:
+            cached = (field, self._resolve_zod_type(field))
+            self._zod_type_cache[id(field)] = cached
+        return cached[1]
+
+    def _resolve_zod_type(self, field: USRField) -> str:
+        """Resolve the Zod type for a field (uncached)"""
+        simple = _SIMPLE_ZOD_TYPES.get(field.type)
+        if simple is not None:
+            return simple
+
+        temporal = _TEMPORAL_ZOD_TYPES.get(field.type)
+        if temporal is not None:
             if self._zod_cfg().get("coerce", False):
                 return "z.coerce.date()"
-            return "z.string().time()"
-
-        elif field.type == FieldType.UUID:
-            return "z.string().uuid()"
+            return temporal
 
-        elif field.type == FieldType.LIST or field.type in (
+        if field.type == FieldType.LIST or field.type in (
             FieldType.SET,
             FieldType.FROZENSET,
         ):
@@ -429,37 +502,26 @@ class ZodGenerator(BaseGenerator):
         else:
             return "z.any()"
 
-    def _variant_to_schema_name(self, schema_name: str, variant_name: str) -> str:
-        """Convert variant name to PascalCase schema name"""
-        parts = variant_name.split("_")
-        variant_pascal = "".join(word.capitalize() for word in parts)
-        return f"{schema_name}{variant_pascal}"
-
     def _generate_single_schema(
         self,
         schema_name: str,
         description: str,
         field_defs: list[str],
         is_base_schema: bool = False,
-    ) -> str:
-        """Generate a single Zod schema definition"""
+    ) -> list[str]:
+        """Generate the lines of a single Zod schema definition"""
         lines = []
 
         if description:
-            lines.append("/**")
-            lines.append(f" * {description}")
-            lines.append(" */")
+            lines += ("/**", f" * {description}", " */")
 
         lines.append(f"export const {schema_name}Schema = z.object({{")
-
-        for field_def in field_defs:
-            lines.append(field_def)
+        lines += field_defs
 
         strict = self._zod_cfg().get("strict", False)
-        closing = "}).strict();" if strict else "});"
-        lines.append(closing)
+        lines.append("}).strict();" if strict else "});")
 
-        return "\n".join(lines)
+        return lines
 
     def _generate_typescript_type(
         self, schema_name: str, fields: list[USRField]
@@ -469,20 +531,16 @@ class ZodGenerator(BaseGenerator):
 
     def _get_typescript_type(self, field: USRField) -> str:
         """Get TypeScript type for a field (for type generation)"""
+        simple = _SIMPLE_TS_TYPES.get(field.type)
+        if simple is not None:
+            return simple
 
-        if field.type == FieldType.STRING:
-            return "string"
-        elif field.type == FieldType.INTEGER or field.type == FieldType.FLOAT:
-            return "number"
-        elif field.type == FieldType.BOOLEAN:
-            return "boolean"
-        elif field.type in (FieldType.DATETIME, FieldType.DATE, FieldType.TIME):
+        if field.type in _TEMPORAL_ZOD_TYPES:
             if self._zod_cfg().get("coerce", False):
                 return "Date"
             return "string"
-        elif field.type == FieldType.UUID:
-            return "string"
-        elif field.type == FieldType.LIST or field.type in (
+
+        if field.type == FieldType.LIST or field.type in (
             FieldType.SET,
             FieldType.FROZENSET,
         ):
@@ -530,31 +588,23 @@ class ZodGenerator(BaseGenerator):
     def _generate_complete_file(
         self,
         schema_name: str,
-        schemas: list[str],
+        schemas: list[list[str]],
         types: list[str],
+        out: IO[str],
         enums: list = None,
         external_refs: set[str] | None = None,
         tag_groups: dict[str, list[str]] | None = None,
-    ) -> str:
-        """Generate complete TypeScript file with header, imports, and all schemas"""
+    ) -> None:
+        """Write complete TypeScript file with header, imports, and all schemas
+
+        Lines are written straight to ``out``, each preceded by its newline.
+        """
         enums = enums or []
         external_refs = external_refs or set()
         tag_groups = tag_groups or {}
 
-        lines = [
-            "/**",
-            " * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY",
-            f" * Generated from: {schema_name}",
-            " * Generator: schema-gen Zod generator",
-            " *",
-            " * To regenerate this file, run:",
-            " *     schema-gen generate --target zod",
-            " *",
-            " * Changes to this file will be overwritten.",
-            " */",
-            "",
-            "import { z } from 'zod';",
-        ]
+        write = out.write
+        write(_FILE_HEADER.format(schema_name=schema_name))
 
         # Cross-file imports for nested schema references (POC finding C4).
         # We only import the runtime Zod schema (value).  The inferred TS
@@ -565,9 +615,9 @@ class ZodGenerator(BaseGenerator):
             if ref == schema_name:
                 continue  # self-ref is handled via z.lazy()
             module = ref.lower()
-            lines.append(f"import {{ {ref}Schema }} from './{module}';")
+            write(f"\nimport {{ {ref}Schema }} from './{module}';")
 
-        lines.append("")
+        write("\n")
 
         # Add enum definitions before schemas
         for enum_def in enums:
@@ -576,69 +626,37 @@ class ZodGenerator(BaseGenerator):
                 # Close any */ sequences that would end the JSDoc block early.
                 safe_lines = [line.replace("*/", "*\\/") for line in doc_lines]
                 if len(safe_lines) == 1:
-                    lines.append(f"/** {safe_lines[0]} */")
+                    write(f"\n/** {safe_lines[0]} */")
                 else:
-                    lines.append("/**")
+                    write("\n/**")
                     for doc_line in safe_lines:
-                        lines.append(f" * {doc_line}" if doc_line else " *")
-                    lines.append(" */")
+                        write(f"\n * {doc_line}" if doc_line else "\n *")
+                    write("\n */")
             values = ", ".join(f'"{v}"' for _name, v in enum_def.values)
-            lines.append(f"export const {enum_def.name}Schema = z.enum([{values}]);")
-            lines.append(
-                f"export type {enum_def.name} = z.infer<typeof {enum_def.name}Schema>;"
+            write(f"\nexport const {enum_def.name}Schema = z.enum([{values}]);")
+            write(
+                f"\nexport type {enum_def.name} = z.infer<typeof {enum_def.name}Schema>;"
             )
-            lines.append("")
+            write("\n")
 
-        # Add schemas
-        for i, schema in enumerate(schemas):
-            if i > 0:
-                lines.append("")
-            lines.append(schema)
+        # Add schemas, separated by a blank line
+        for i, schema_lines in enumerate(schemas):
+            write("\n\n" if i > 0 else "\n")
+            write("\n".join(schema_lines))
 
-        lines.append("")
+        write("\n")
 
         # Add TypeScript types
         for type_def in types:
-            lines.append(type_def)
+            write("\n")
+            write(type_def)
 
         # Add field-tag constants
         if tag_groups:
-            lines.append("")
+            write("\n")
             for tag, field_names in tag_groups.items():
                 const_name = f"{tag.upper()}_FIELDS"
                 type_name = _tag_to_type_name(tag)
                 fields_str = ", ".join(f"'{f}'" for f in field_names)
-                lines.append(f"export const {const_name} = [{fields_str}] as const;")
-                lines.append(
-                    f"export type {type_name} = (typeof {const_name})[number];"
-                )
-
-        return "\n".join(lines)
-
-    def _get_template(self) -> str:
-        """Get the Jinja2 template for Zod schemas"""
-        return """/**
- * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
- * Generated from: {{ base_schema_name }}{% if variant_name %} ({{ variant_name }} variant){% endif %}
- * Generator: schema-gen Zod generator
- *
- * To regenerate this file, run:
- *     schema-gen generate --target zod
- *
- * Changes to this file will be overwritten.
- */
-
-import { z } from 'zod';
-
-{%- if description %}
-/**
- * {{ description }}
- */
-{%- endif %}
-export const {{ schema_name }}Schema = z.object({
-{%- for field_def in fields %}
-{{ field_def }}
-{%- endfor %}
-});
-
-export type {{ schema_name }} = z.infer<typeof {{ schema_name }}Schema>;"""
+                write(f"\nexport const {const_name} = [{fields_str}] as const;")
+                write(f"\nexport type {type_name} = (typeof {const_name})[number];")
@@ -4,6 +4,7 @@ import inspect
 import logging
 import re
 import warnings
+import weakref
 from enum import Enum
 
 from ..core.schema import SchemaRegistry, _extract_meta_attributes
@@ -78,6 +79,16 @@ class SchemaParser:
 
     def __init__(self):
         self.type_mapper = TypeMapper()
+        # Parsed schemas keyed by class. Schema classes do not change after
+        # decoration, so each one is converted once per parser. Weak keys let
+        # classes replaced by a schema reload be collected with their entry.
+        self._cache: weakref.WeakKeyDictionary[type, USRSchema] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def invalidate(self) -> None:
+        """Drop cached USR schemas so the next parse rebuilds them"""
+        self._cache.clear()
 
     def parse_schema(self, schema_class: type) -> USRSchema:
         """Convert a schema_gen Schema class to USR format
@@ -86,8 +97,12 @@ class SchemaParser:
             schema_class: Class decorated with @Schema
 
         Returns:
-            USRSchema representation
+            USRSchema representation (cached per schema class)
         """
+        cached = self._cache.get(schema_class)
+        if cached is not None:
+            return cached
+
         if not hasattr(schema_class, "_schema_fields"):
             raise ValueError(
                 f"Class {schema_class.__name__} is not a valid Schema. Use @Schema decorator."
@@ -195,12 +210,15 @@ class SchemaParser:
         # Extract variants if defined
         variants = {}
         if hasattr(schema_class, "Variants"):
-            variants_class = schema_class.Variants
-            for attr_name in dir(variants_class):
-                if not attr_name.startswith("_"):
-                    attr_value = getattr(variants_class, attr_name)
-                    if isinstance(attr_value, list):
-                        variants[attr_name] = attr_value
+            # Read class namespaces directly (base classes first, so
+            # subclasses override) and keep dir()'s alphabetical order.
+            namespace = {}
+            for klass in reversed(schema_class.Variants.__mro__):
+                namespace.update(vars(klass))
+            for attr_name in sorted(namespace):
+                attr_value = namespace[attr_name]
+                if not attr_name.startswith("_") and isinstance(attr_value, list):
+                    variants[attr_name] = attr_value
 
         # Extract custom code if available
         custom_code = getattr(schema_class, "_custom_code", {})
@@ -224,6 +242,8 @@ class SchemaParser:
             custom_code=custom_code,
             metadata={},
         )
+        for variant_name in variants:
+            usr_schema.get_variant_class_name(variant_name)
 
         # Validate the parsed schema
         issues = usr_schema.validate()
@@ -247,6 +267,7 @@ class SchemaParser:
                 + "\n".join(error_msgs)
             )
 
+        self._cache[schema_class] = usr_schema
         return usr_schema
 
     def _resolve_discriminator_tags(self, usr_field: USRField) -> list[str]:
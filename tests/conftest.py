@@ -0,0 +1,12 @@
+"""Shared pytest fixtures"""
+
+import pytest
+
+from schema_gen.core.schema import SchemaRegistry
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    """Give each test an empty registry, restored afterwards"""
+    with SchemaRegistry.isolated():
+        yield
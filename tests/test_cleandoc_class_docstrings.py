@@ -14,7 +14,6 @@ from enum import Enum
 from pathlib import Path
 
 from schema_gen import Field, Schema
-from schema_gen.core.schema import SchemaRegistry
 from schema_gen.generators.jsonschema_generator import JsonSchemaGenerator
 from schema_gen.generators.pydantic_generator import PydanticGenerator
 from schema_gen.generators.rust_generator import RustGenerator
@@ -22,13 +21,7 @@ from schema_gen.generators.zod_generator import ZodGenerator
 from schema_gen.parsers.schema_parser import SchemaParser
 
 
-def _reset_registry() -> None:
-    SchemaRegistry._schemas.clear()
-
-
 def test_schema_docstring_is_dedented():
-    _reset_registry()
-
     @Schema
     class WithMultilineDoc:
         """Summary line.
@@ -51,8 +44,6 @@ def test_schema_docstring_is_dedented():
 
 
 def test_enum_docstring_is_dedented():
-    _reset_registry()
-
     class Mode(str, Enum):
         """Summary line.
 
@@ -77,7 +68,6 @@ def test_enum_docstring_is_dedented():
 
 def test_jsonschema_description_is_dedented():
     """End-to-end: dedent applies through to the JSON Schema output."""
-    _reset_registry()
 
     @Schema
     class WithMultilineDoc:
@@ -105,7 +95,6 @@ def test_jsonschema_description_is_dedented():
 
 def test_single_line_docstring_unchanged():
     """`inspect.cleandoc` on a flat single-line docstring is a no-op."""
-    _reset_registry()
 
     @Schema
     class Flat:
@@ -120,7 +109,6 @@ def test_single_line_docstring_unchanged():
 
 def test_no_docstring_yields_none():
     """Regression guard: schemas without a docstring keep `description=None`."""
-    _reset_registry()
 
     @Schema
     class NoDoc:
@@ -133,7 +121,6 @@ def test_no_docstring_yields_none():
 
 def test_all_generators_run_without_error_on_dedented_docstring(tmp_path: Path):
     """Smoke test: every code-emitting generator handles the dedented form."""
-    _reset_registry()
 
     @Schema
     class Multi:
@@ -10,7 +10,6 @@ import logging
 
 from schema_gen import Field, Schema
 from schema_gen.core.config import Config
-from schema_gen.core.schema import SchemaRegistry
 from schema_gen.generators.jsonschema_generator import JsonSchemaGenerator
 from schema_gen.generators.rust_generator import RustGenerator
 from schema_gen.generators.zod_generator import ZodGenerator
@@ -23,7 +22,6 @@ from schema_gen.parsers.schema_parser import SchemaParser
 
 def _make_usr_schema():
     """Return a minimal USRSchema used across all generator tests."""
-    SchemaRegistry._schemas.clear()
 
     @Schema
     class _WiringTestModel:
@@ -75,8 +73,6 @@ class TestRustConfigWiring:
         config = Config(rust={"json_schema_derive": False})
         gen = RustGenerator(config=config)
 
-        SchemaRegistry._schemas.clear()
-
         from schema_gen.core.usr import FieldType, USRField, USRSchema
 
         # Build a schema whose SerdeMeta explicitly enables json_schema_derive
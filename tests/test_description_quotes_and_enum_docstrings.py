@@ -7,12 +7,10 @@
   and JSON Schema targets.
 """
 
-import ast
 from enum import Enum
 from pathlib import Path
 
 from schema_gen import Field, Schema
-from schema_gen.core.schema import SchemaRegistry
 from schema_gen.generators.jsonschema_generator import JsonSchemaGenerator
 from schema_gen.generators.pydantic_generator import PydanticGenerator
 from schema_gen.generators.rust_generator import RustGenerator
@@ -32,15 +30,9 @@ _ENUM_DOC = (
 )
 
 
-def _reset_registry() -> None:
-    SchemaRegistry._schemas.clear()
-
-
 def _parse_schema_with_quoted_description() -> list:
     """Schema with a literal ``"`` inside ``Field(description=...)`` (#70)."""
 
-    _reset_registry()
-
     @Schema
     class QuoteDescMsg:
         type: str = Field(
@@ -54,8 +46,6 @@ def _parse_schema_with_quoted_description() -> list:
 def _parse_schema_with_docstring_enum() -> list:
     """Schema referencing an enum that carries a class docstring (#71)."""
 
-    _reset_registry()
-
     class Timeframe(str, Enum):
         """Footprint candle window durations.
 
@@ -90,9 +80,9 @@ class TestPydanticDescriptionEscaping:
 
         # Must parse as valid Python regardless of what the description
         # contains — this is the regression we're guarding against.
-        ast.parse(model_code)
+        compile(model_code, "<model>", "exec")
         for content in extra.values():
-            ast.parse(content)
+            compile(content, "<extra>", "exec")
 
         # And the description text itself must round-trip: the inner
         # quotes should be escaped, not dropped.
@@ -112,7 +102,7 @@ class TestEnumDocstringPropagation:
         enums_py = extra["_enums.py"]
 
         # The generated file must still be valid Python.
-        ast.parse(enums_py)
+        compile(enums_py, "_enums.py", "exec")
         assert "Footprint candle window durations." in enums_py
         assert "coordinated updates" in enums_py
 
@@ -149,8 +139,6 @@ class TestEnumDocstringPropagation:
     def test_enum_without_docstring_unchanged(self):
         """Regression guard: enums with no docstring must still work."""
 
-        _reset_registry()
-
         class Plain(str, Enum):
             A = "a"
             B = "b"
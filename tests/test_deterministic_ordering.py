@@ -12,7 +12,7 @@ from enum import Enum
 
 from pydantic import BaseModel
 
-from schema_gen.core.schema import Schema, SchemaRegistry
+from schema_gen.core.schema import Schema
 from schema_gen.parsers.schema_parser import SchemaParser
 
 
@@ -28,13 +28,7 @@ class MKind(Enum):
     K = "k"
 
 
-def _reset_registry() -> None:
-    SchemaRegistry._schemas.clear()
-
-
 def test_parse_all_schemas_sorted_by_name() -> None:
-    _reset_registry()
-
     @Schema
     class Zeta(BaseModel):
         x: int
@@ -52,8 +46,6 @@ def test_parse_all_schemas_sorted_by_name() -> None:
 
 
 def test_parse_schema_enums_sorted_by_name() -> None:
-    _reset_registry()
-
     @Schema
     class Thing(BaseModel):
         # Declare fields so enums are encountered in a non-alphabetical order.
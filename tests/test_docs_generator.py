@@ -4,7 +4,6 @@ from enum import Enum
 from pathlib import Path
 
 from schema_gen import Config, Field, Schema
-from schema_gen.core.schema import SchemaRegistry
 from schema_gen.generators.docs_generator import DocsGenerator
 from schema_gen.parsers.schema_parser import SchemaParser
 
@@ -15,9 +14,6 @@ class _Status(str, Enum):
 
 
 class TestDocsFieldTable:
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_field_table_rendered(self):
         @Schema
         class User:
@@ -42,9 +38,6 @@ class TestDocsFieldTable:
 
 
 class TestDocsEnumSection:
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_enum_table_rendered(self):
         @Schema
         class Order:
@@ -60,9 +53,6 @@ class TestDocsEnumSection:
 
 
 class TestDocsVariants:
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_variants_section(self):
         @Schema
         class Item:
@@ -85,9 +75,6 @@ class TestDocsVariants:
 
 
 class TestDocsCrossReferences:
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_nested_type_linked(self):
         @Schema
         class Address:
@@ -108,9 +95,6 @@ class TestDocsCrossReferences:
 
 
 class TestDocsIndex:
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_index_page(self):
         @Schema
         class Alpha:
@@ -140,9 +124,6 @@ class TestDocsIndex:
 
 
 class TestDocsConfigTitle:
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_custom_title(self):
         @Schema
         class Foo:
@@ -157,9 +138,6 @@ class TestDocsConfigTitle:
 
 
 class TestDocsRequiredVsOptional:
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_required_and_optional_fields(self):
         @Schema
         class Mixed:
@@ -148,7 +148,6 @@ class TestE2ECompile:
         self.out_dir.mkdir()
 
         # Register all schemas
-        SchemaRegistry._schemas.clear()
         for cls in (
             E2EAddress,
             E2ECustomer,
@@ -259,11 +258,24 @@ class TestE2ECompile:
     # Zod/TypeScript: tsc --noEmit --strict
     # ------------------------------------------------------------------
 
-    @pytest.mark.skipif(not shutil.which("npx"), reason="npx not installed")
+    @pytest.mark.skipif(not shutil.which("tsc"), reason="tsc not installed")
     def test_zod_tsc_check(self):
         self._generate_targets(["zod"])
         zod_dir = self.out_dir / "zod"
 
+        # Resolve ``import { z } from 'zod';`` against the globally
+        # installed package (as CI does) instead of running a networked
+        # ``npm install`` on every test run.
+        npm_root = subprocess.run(
+            ["npm", "root", "-g"], capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+        global_zod = Path(npm_root) / "zod"
+        if not global_zod.exists():
+            pytest.skip("zod not installed globally — `npm install -g zod`")
+        node_modules = zod_dir / "node_modules"
+        node_modules.mkdir()
+        (node_modules / "zod").symlink_to(global_zod)
+
         # Create a minimal tsconfig.json
         tsconfig = {
             "compilerOptions": {
@@ -278,27 +290,8 @@ class TestE2ECompile:
         }
         (zod_dir / "tsconfig.json").write_text(json.dumps(tsconfig))
 
-        # Install zod locally
-        result = subprocess.run(
-            ["npm", "init", "-y"],
-            cwd=zod_dir,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-
-        result = subprocess.run(
-            ["npm", "install", "zod", "typescript"],
-            cwd=zod_dir,
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-        if result.returncode != 0:
-            pytest.skip(f"npm install failed: {result.stderr}")
-
         result = subprocess.run(
-            ["npx", "tsc", "--noEmit", "--strict"],
+            ["tsc", "--noEmit", "--strict"],
             cwd=zod_dir,
             capture_output=True,
             text=True,
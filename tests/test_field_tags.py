@@ -5,16 +5,12 @@ from pathlib import Path
 import pytest
 
 from schema_gen import Field, Schema
-from schema_gen.core.schema import SchemaRegistry
 from schema_gen.generators.rust_generator import RustGenerator
 from schema_gen.generators.zod_generator import ZodGenerator
 from schema_gen.parsers.schema_parser import SchemaParser
 
 
 class TestFieldTagParsing:
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_tags_propagated_to_usr_field(self):
         @Schema
         class MyDTO:
@@ -123,9 +119,6 @@ class TestFieldTagParsing:
 
 
 class TestZodTagEmission:
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def _generate(self, schema_cls):
         parser = SchemaParser()
         schema = parser.parse_schema(schema_cls)
@@ -204,9 +197,6 @@ class TestZodTagEmission:
 
 
 class TestRustTagEmission:
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def _generate(self, schema_cls):
         parser = SchemaParser()
         schema = parser.parse_schema(schema_cls)
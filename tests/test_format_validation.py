@@ -18,6 +18,9 @@ favor of the three test files above, which fail loudly.
 """
 
 import json
+import re
+
+import pytest
 
 from schema_gen import Field, Schema
 from schema_gen.core.schema import SchemaRegistry
@@ -29,13 +32,13 @@ from schema_gen.generators.sqlalchemy_generator import SqlAlchemyGenerator
 from schema_gen.generators.typeddict_generator import TypedDictGenerator
 from schema_gen.parsers.schema_parser import SchemaParser
 
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
 
-class TestCrossFormatConsistency:
-    """Test that all formats generate consistent field mappings"""
 
-    def setup_method(self):
-        """Set up test schema"""
-        SchemaRegistry._schemas.clear()
+@pytest.fixture(scope="class")
+def consistency_schema():
+    """Parse the consistency schema once for the whole test class"""
+    with SchemaRegistry.isolated():
 
         @Schema
         class ConsistencyTest:
@@ -48,11 +51,13 @@ class TestCrossFormatConsistency:
             constrained_float: float = Field(min_value=0.0, max_value=100.0)
             boolean_field: bool = Field(default=False)
 
-        parser = SchemaParser()
-        self.schemas = parser.parse_all_schemas()
-        self.test_schema = self.schemas[0]
+        return SchemaParser().parse_schema(ConsistencyTest)
+
 
-    def test_field_presence_consistency(self):
+class TestCrossFormatConsistency:
+    """Test that all formats generate consistent field mappings"""
+
+    def test_field_presence_consistency(self, consistency_schema):
         """Test that all generators include the same fields"""
         generators = {
             "pydantic": PydanticGenerator(),
@@ -62,21 +67,21 @@ class TestCrossFormatConsistency:
             "pathway": PathwayGenerator(),
         }
 
-        field_names = {field.name for field in self.test_schema.fields}
+        field_names = {field.name for field in consistency_schema.fields}
 
         for generator_name, generator in generators.items():
-            generated_code = generator.generate_file(self.test_schema)
+            generated_code = generator.generate_file(consistency_schema)
 
-            # Check that all field names appear in generated code
-            for field_name in field_names:
-                assert field_name in generated_code, (
-                    f"Field '{field_name}' missing from {generator_name} output"
-                )
+            # Check that all field names appear as identifiers in generated code
+            missing = field_names - set(_IDENTIFIER_RE.findall(generated_code))
+            assert not missing, (
+                f"Fields {sorted(missing)} missing from {generator_name} output"
+            )
 
-    def test_required_fields_consistency(self):
+    def test_required_fields_consistency(self, consistency_schema):
         """Test that required fields are consistently marked across formats"""
         json_generator = JsonSchemaGenerator()
-        schema_json = json_generator.generate_model(self.test_schema)
+        schema_json = json_generator.generate_model(consistency_schema)
         schema = json.loads(schema_json)
 
         # Required fields should include fields without defaults
@@ -38,7 +38,6 @@ class _MultiLineDescSchema:
 
 
 def _parse():
-    SchemaRegistry._schemas.clear()
     SchemaRegistry.register(_MultiLineDescSchema)
     return SchemaParser().parse_schema(_MultiLineDescSchema)
 
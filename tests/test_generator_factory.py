@@ -1,8 +1,5 @@
 """Test generator factory functions"""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from schema_gen.core.generator import create_generation_engine
@@ -11,10 +8,6 @@ from schema_gen.core.generator import create_generation_engine
 class TestGeneratorFactory:
     """Test generator factory functions"""
 
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
-
     def test_create_generation_engine_default(self):
         """Test creating engine with default config"""
         engine = create_generation_engine("nonexistent.config.py")
@@ -25,10 +18,10 @@ class TestGeneratorFactory:
         assert engine.config.output_dir == "generated/"
         assert engine.config.targets == ["pydantic"]
 
-    def test_create_generation_engine_with_valid_config(self):
+    def test_create_generation_engine_with_valid_config(self, tmp_path):
         """Test creating engine with valid config file"""
         # Create a valid config file
-        config_file = self.temp_path / "test.config.py"
+        config_file = tmp_path / "test.config.py"
         config_file.write_text("""
 from schema_gen.core.config import Config
 
@@ -45,17 +38,17 @@ config = Config(
         assert engine.config.output_dir == "test_output"
         assert engine.config.targets == ["pydantic", "sqlalchemy"]
 
-    def test_create_generation_engine_invalid_config(self):
+    def test_create_generation_engine_invalid_config(self, tmp_path):
         """Test creating engine with invalid config file raises SyntaxError"""
-        config_file = self.temp_path / "invalid.config.py"
+        config_file = tmp_path / "invalid.config.py"
         config_file.write_text("invalid python syntax !!!!")
 
         with pytest.raises(SyntaxError):
             create_generation_engine(str(config_file))
 
-    def test_create_generation_engine_no_config_var(self):
+    def test_create_generation_engine_no_config_var(self, tmp_path):
         """Test creating engine from file without config variable raises ValueError"""
-        config_file = self.temp_path / "no_config.config.py"
+        config_file = tmp_path / "no_config.config.py"
         config_file.write_text("""
 some_other_var = "hello"
 """)
@@ -37,6 +37,7 @@ Bugs missed by snapshot/syntax tests but caught here:
 
 from __future__ import annotations
 
+import functools
 import json
 import shutil
 import subprocess
@@ -93,11 +94,20 @@ class FrameworkOrder:
 
 
 def _parse():
-    SchemaRegistry._schemas.clear()
     SchemaRegistry.register(FrameworkOrder)
     return SchemaParser().parse_schema(FrameworkOrder)
 
 
+@functools.cache
+def _generate(generator_cls: type) -> str:
+    """Return the generated FrameworkOrder file for ``generator_cls``.
+
+    Generator output is deterministic, so each generator runs once and tests
+    exercising the same generator share its output.
+    """
+    return generator_cls().generate_file(_parse())
+
+
 def _exec_module(source: str, name: str) -> ModuleType:
     """Compile ``source`` into a fresh module and return it.
 
@@ -124,7 +134,7 @@ class TestPydanticFrameworkExecution:
     """Generated Pydantic file must be executable and produce a working model."""
 
     def test_module_imports_and_model_instantiates(self):
-        out = PydanticGenerator().generate_file(_parse())
+        out = _generate(PydanticGenerator)
         mod = _exec_module(out, "pydantic_framework_test")
         cls = mod.FrameworkOrder
         # Must be a real Pydantic v2 BaseModel subclass.
@@ -148,7 +158,7 @@ class TestPydanticFrameworkExecution:
     def test_validation_rejects_bad_input(self):
         from pydantic import ValidationError
 
-        out = PydanticGenerator().generate_file(_parse())
+        out = _generate(PydanticGenerator)
         mod = _exec_module(out, "pydantic_framework_test_validate")
         cls = mod.FrameworkOrder
         with pytest.raises(ValidationError):
@@ -174,7 +184,7 @@ class TestSqlalchemyFrameworkExecution:
         # can read annotations off the original module (the in-memory exec
         # path leaves ``__module__`` as ``builtins`` and breaks ``Mapped[T]``
         # lookup).
-        out = SqlAlchemyGenerator().generate_file(_parse())
+        out = _generate(SqlAlchemyGenerator)
         pkg_dir = tmp_path / "_sqlalchemy_framework_pkg"
         pkg_dir.mkdir()
         (pkg_dir / "__init__.py").write_text("")
@@ -216,7 +226,7 @@ class TestDataclassesFrameworkExecution:
     def test_module_compiles_and_dataclass_instantiates(self):
         from dataclasses import is_dataclass
 
-        out = DataclassesGenerator().generate_file(_parse())
+        out = _generate(DataclassesGenerator)
         mod = _exec_module(out, "dataclasses_framework_test")
         cls = mod.FrameworkOrder
         assert is_dataclass(cls)
@@ -241,7 +251,7 @@ class TestDataclassesFrameworkExecution:
 
 class TestTypedDictFrameworkExecution:
     def test_module_compiles_and_annotations_match_schema(self):
-        out = TypedDictGenerator().generate_file(_parse())
+        out = _generate(TypedDictGenerator)
         mod = _exec_module(out, "typeddict_framework_test")
         cls = mod.FrameworkOrder
         # TypedDict carries the field set on ``__annotations__``.
@@ -263,7 +273,7 @@ class TestPathwayFrameworkExecution:
 
         if importlib.util.find_spec("pathway") is None:
             pytest.skip("pathway not installed")
-        out = PathwayGenerator().generate_file(_parse())
+        out = _generate(PathwayGenerator)
         mod = _exec_module(out, "pathway_framework_test")
         cls = mod.FrameworkOrder
         # Pathway codegen emits a class that inherits from pw.Table (one of
@@ -282,21 +292,35 @@ class TestPathwayFrameworkExecution:
 # -----------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session")
+def jsonschema_dict():
+    """The generated FrameworkOrder JSON Schema, parsed once per session."""
+    return json.loads(_generate(JsonSchemaGenerator))
+
+
+@pytest.fixture(scope="session")
+def jsonschema_validator(jsonschema_dict):
+    """Validator for the generated FrameworkOrder JSON Schema.
+
+    Built once per session so sample-document checks reuse the compiled
+    validator instead of rebuilding it on every ``jsonschema.validate`` call.
+    """
+    import jsonschema
+
+    return jsonschema.validators.validator_for(jsonschema_dict)(jsonschema_dict)
+
+
 class TestJsonSchemaFrameworkExecution:
-    def test_output_is_valid_json_schema(self):
+    def test_output_is_valid_json_schema(self, jsonschema_dict):
         import jsonschema
 
-        out = JsonSchemaGenerator().generate_file(_parse())
-        schema = json.loads(out)
         # The output must itself satisfy the JSON Schema meta-schema.
         # ``jsonschema.Draft202012Validator.check_schema`` raises if not.
-        jsonschema.Draft202012Validator.check_schema(schema)
+        jsonschema.Draft202012Validator.check_schema(jsonschema_dict)
 
-    def test_sample_document_validates_against_generated_schema(self):
-        import jsonschema
-
-        out = JsonSchemaGenerator().generate_file(_parse())
-        schema = json.loads(out)
+    def test_sample_document_validates_against_generated_schema(
+        self, jsonschema_validator
+    ):
         # Provide a non-null ``tag`` since the JSON Schema generator currently
         # emits ``"type": "string"`` for the optional field rather than
         # ``["string", "null"]`` — that shape mismatch is a separate issue;
@@ -311,7 +335,7 @@ class TestJsonSchemaFrameworkExecution:
         }
         # Validate against the whole document so the top-level ``$ref`` to
         # ``#/$defs/FrameworkOrder`` resolves naturally.
-        jsonschema.validate(instance=sample, schema=schema)
+        jsonschema_validator.validate(sample)
 
 
 # -----------------------------------------------------------------------
@@ -323,7 +347,7 @@ class TestGraphQLFrameworkExecution:
     def test_output_parses_as_graphql_sdl(self):
         from graphql import GraphQLSyntaxError, parse
 
-        out = GraphQLGenerator().generate_file(_parse())
+        out = _generate(GraphQLGenerator)
         try:
             doc = parse(out)
         except GraphQLSyntaxError as exc:
@@ -345,7 +369,7 @@ class TestAvroFrameworkExecution:
             pytest.skip("fastavro not installed")
         from schema_gen.generators.avro_generator import AvroGenerator
 
-        out = AvroGenerator().generate_file(_parse())
+        out = _generate(AvroGenerator)
         wrapper = json.loads(out)
         # The Avro generator wraps the actual schema(s) in a metadata
         # envelope (``{"_meta": ..., "schemas": [...]}``). Iterate every
@@ -371,7 +395,7 @@ class TestProtobufFrameworkExecution:
                 "protoc not on PATH — install protobuf-compiler "
                 "(`apt-get install protobuf-compiler` / `brew install protobuf`)"
             )
-        out = ProtobufGenerator().generate_file(_parse())
+        out = _generate(ProtobufGenerator)
         with tempfile.TemporaryDirectory() as tmp:
             tmpdir = Path(tmp)
             proto_path = tmpdir / "_framework_order.proto"
@@ -410,7 +434,7 @@ class TestRustFrameworkExecution:
             pytest.skip(
                 "cargo not on PATH — install Rust (https://rustup.rs) to run this test"
             )
-        out = RustGenerator().generate_file(_parse())
+        out = _generate(RustGenerator)
         # Build a minimal crate: Cargo.toml + src/lib.rs that includes the
         # generated module. ``cargo check`` runs the type-checker without
         # producing an artifact — fast enough for pre-push.
@@ -476,7 +500,7 @@ class TestZodFrameworkExecution:
         node_modules.mkdir()
         (node_modules / "zod").symlink_to(global_zod)
 
-        out = ZodGenerator().generate_file(_parse())
+        out = _generate(ZodGenerator)
         ts_file = tmp_path / "framework_order.ts"
         ts_file.write_text(out)
         result = subprocess.run(
@@ -515,7 +539,7 @@ class TestKotlinFrameworkExecution:
                 "kotlinc not on PATH — install the Kotlin compiler "
                 "(https://kotlinlang.org/docs/command-line.html) to run this test"
             )
-        out = KotlinGenerator().generate_file(_parse())
+        out = _generate(KotlinGenerator)
         kt_file = tmp_path / "FrameworkOrder.kt"
         kt_file.write_text(out)
         # Resolve a classpath for kotlinx-serialization. CI is expected to
@@ -570,7 +594,7 @@ class TestJacksonFrameworkExecution:
                 "javac not on PATH — install a JDK "
                 "(`apt-get install default-jdk` / Adoptium) to run this test"
             )
-        out = JacksonGenerator().generate_file(_parse())
+        out = _generate(JacksonGenerator)
         # Generator emits ``package com.example.models;`` — mirror that
         # in the on-disk layout so javac can find the file by package.
         pkg_dir = tmp_path / "com" / "example" / "models"
@@ -84,7 +84,6 @@ class CanonicalOrder:
 
 
 def _parse_canonical():
-    SchemaRegistry._schemas.clear()
     SchemaRegistry.register(CanonicalOrder)
     return SchemaParser().parse_schema(CanonicalOrder)
 
@@ -1,12 +1,18 @@
 """Comprehensive tests for all schema generators"""
 
+import copy
+import io
 import json
-from datetime import datetime
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Annotated, Literal
 
 import pytest
 
 from schema_gen import Field, Schema
 from schema_gen.core.schema import SchemaRegistry
+from schema_gen.core.usr import FieldType, TypeMapper, USRField, USRSchema
 from schema_gen.generators.avro_generator import AvroGenerator
 from schema_gen.generators.dataclasses_generator import DataclassesGenerator
 from schema_gen.generators.graphql_generator import GraphQLGenerator
@@ -22,16 +28,10 @@ from schema_gen.generators.zod_generator import ZodGenerator
 from schema_gen.parsers.schema_parser import SchemaParser
 
 
-class TestAllGenerators:
-    """Test all generators with a comprehensive schema"""
-
-    def setup_method(self):
-        """Clear registry before each test"""
-        SchemaRegistry._schemas.clear()
-
-    @pytest.fixture
-    def comprehensive_schema(self):
-        """Create a comprehensive test schema"""
+@pytest.fixture(scope="module")
+def comprehensive_schema():
+    """Parse the comprehensive test schema once for the whole module"""
+    with SchemaRegistry.isolated():
 
         @Schema
         class TestUser:
@@ -59,6 +59,23 @@ class TestAllGenerators:
         parser = SchemaParser()
         return parser.parse_schema(TestUser)
 
+
+@pytest.fixture
+def mutable_comprehensive_schema(comprehensive_schema):
+    """Copy for tests that set schema-level overrides
+
+    Only the override dicts are copied; fields and variants stay shared
+    with the module-scoped schema, which these tests never mutate.
+    """
+    schema = copy.copy(comprehensive_schema)
+    schema.metadata = dict(schema.metadata)
+    schema.target_config = dict(schema.target_config)
+    return schema
+
+
+class TestAllGenerators:
+    """Test all generators with a comprehensive schema"""
+
     def test_pydantic_generator(self, comprehensive_schema):
         """Test Pydantic generator"""
         generator = PydanticGenerator()
@@ -95,6 +112,174 @@ class TestAllGenerators:
         # Verify it compiles as valid Python
         compile(file_content, "<test>", "exec")
 
+    def test_sqlalchemy_generate_all_variants(self, comprehensive_schema):
+        """Test SQLAlchemy generate_all_variants matches per-variant output"""
+        generator = SqlAlchemyGenerator()
+        all_variants = generator.generate_all_variants(comprehensive_schema)
+
+        assert list(all_variants) == ["base", *comprehensive_schema.variants]
+        assert all_variants["base"] == generator.generate_model(comprehensive_schema)
+        for variant_name in comprehensive_schema.variants:
+            assert all_variants[variant_name] == generator.generate_model(
+                comprehensive_schema, variant_name
+            )
+            compile(all_variants[variant_name], f"<{variant_name}>", "exec")
+
+    def test_sqlalchemy_model_with_relationship_compiles(self):
+        """Test SQLAlchemy model output with relationships is valid Python"""
+
+        @Schema
+        class Author:
+            """Author with books"""
+
+            id: int = Field(primary_key=True)
+            books: list[str] = Field(
+                default_factory=list,
+                relationship="one_to_many",
+                back_populates="author",
+            )
+
+        parser = SchemaParser()
+        schema = parser.parse_schema(Author)
+        model = SqlAlchemyGenerator().generate_model(schema)
+
+        assert 'books = relationship("' in model
+        assert "orm.relationship" not in model
+        compile(model, "<test>", "exec")
+
+    def test_sqlalchemy_simple_template_matches_full_template(self):
+        """Test the SQLAlchemy fast-path template renders like the full one"""
+        generator = SqlAlchemyGenerator()
+        context = {
+            "model_name": "Plain",
+            "table_name": "plain",
+            "schema_name": "Plain",
+            "variant_name": None,
+            "docstring_lines": ['    """Plain model"""'],
+            "sa_imports": ["String", "func"],
+            "columns": [
+                "    id: Mapped[int] = mapped_column(primary_key=True)",
+                "    name: Mapped[str] = mapped_column(String(20))",
+            ],
+            "relationships": [],
+        }
+
+        assert generator.simple_template.render(**context) == generator.template.render(
+            **context
+        )
+
+    def test_sqlalchemy_fixed_type_mappings(self):
+        """Test SQLAlchemy column types that do not depend on field settings"""
+
+        @Schema
+        class FixedTypesModel:
+            """Model covering the fixed type mappings"""
+
+            id: int = Field(primary_key=True)
+            ratio: float
+            active: bool
+            uid: uuid.UUID
+            birthday: date
+            seen_at: datetime
+            tags: set[str]
+
+        parser = SchemaParser()
+        schema = parser.parse_schema(FixedTypesModel)
+        generator = SqlAlchemyGenerator()
+        file_content = generator.generate_file(schema)
+
+        assert "ratio: Mapped[float] = mapped_column()" in file_content
+        assert "active: Mapped[bool] = mapped_column()" in file_content
+        assert "uid: Mapped[uuid.UUID] = mapped_column(Uuid)" in file_content
+        assert "birthday: Mapped[date] = mapped_column()" in file_content
+        assert "seen_at: Mapped[datetime] = mapped_column()" in file_content
+        assert "tags: Mapped[Any] = mapped_column(JSON)" in file_content
+        assert "from datetime import date, datetime" in file_content
+        assert "from sqlalchemy import JSON, Uuid" in file_content
+        assert "import uuid" in file_content
+        assert "from typing import Any" in file_content
+
+        compile(file_content, "<test>", "exec")
+
+    def test_sqlalchemy_imports_ignore_column_text(self):
+        """Test SQLAlchemy imports come from field types, not column text"""
+
+        @Schema
+        class LabelModel:
+            """Model whose defaults mention type names"""
+
+            id: int = Field(primary_key=True)
+            label: str = Field(default="Any Decimal, uuid.UUID or Text)")
+
+        parser = SchemaParser()
+        schema = parser.parse_schema(LabelModel)
+        generator = SqlAlchemyGenerator()
+        file_content = generator.generate_file(schema)
+
+        assert "from typing import Any" not in file_content
+        assert "from decimal import Decimal" not in file_content
+        assert "import uuid" not in file_content
+        assert "from sqlalchemy import Text\n" in file_content
+
+    def test_field_types_resolved_once_per_file(
+        self, comprehensive_schema, monkeypatch
+    ):
+        """Fields shared by variants are type-resolved once per generate call"""
+        for generator, resolver in [
+            (TypedDictGenerator(), "_generate_field_definition"),
+            (ZodGenerator(), "_resolve_zod_type"),
+        ]:
+            calls = []
+            original = getattr(generator, resolver)
+
+            def counting(field, *args, _original=original, _calls=calls):
+                _calls.append(field.name)
+                return _original(field, *args)
+
+            monkeypatch.setattr(generator, resolver, counting)
+
+            first = generator.generate_file(comprehensive_schema)
+            assert sorted(calls) == sorted(f.name for f in comprehensive_schema.fields)
+
+            # The cache does not outlive a call: regenerating resolves again
+            calls.clear()
+            assert generator.generate_file(comprehensive_schema) == first
+            assert len(calls) == len(comprehensive_schema.fields)
+
+    def test_nested_field_types_resolved_once_per_file(self, monkeypatch):
+        """Inner and union member types are resolved once, not per variant"""
+
+        @Schema
+        class Nested:
+            """Schema with container and union fields"""
+
+            tags: list[str]
+            either: int | str
+
+            class Variants:
+                both = ["tags", "either"]
+                tags_only = ["tags"]
+
+        schema = SchemaParser().parse_schema(Nested)
+
+        for generator, resolver in [
+            (TypedDictGenerator(), "_get_python_type"),
+            (ZodGenerator(), "_resolve_zod_type"),
+        ]:
+            calls = []
+            original = getattr(generator, resolver)
+
+            def counting(field, *args, _original=original, _calls=calls):
+                _calls.append(field)
+                return _original(field, *args)
+
+            monkeypatch.setattr(generator, resolver, counting)
+            generator.generate_file(schema)
+
+            # tags, its str inner type, either, and its int / str members
+            assert len(calls) == 5
+            assert len({id(field) for field in calls}) == 5
+
     def test_zod_generator(self, comprehensive_schema):
         """Test Zod generator"""
         generator = ZodGenerator()
@@ -164,6 +349,32 @@ class TestAllGenerators:
         # Verify it compiles as valid Python
         compile(file_content, "<test>", "exec")
 
+    def test_typeddict_module_imports_resolve(self):
+        """Test TypedDict imports cover datetime, decimal and uuid annotations"""
+
+        @Schema
+        class Ledger:
+            """Ledger entry"""
+
+            id: uuid.UUID
+            amount: Decimal
+            booked_on: date
+            booked_at: datetime | None = None
+
+        schema = SchemaParser().parse_schema(Ledger)
+        file_content = TypedDictGenerator().generate_file(schema)
+
+        assert "import datetime\nimport decimal\nimport uuid\n" in file_content
+        # Annotations are evaluated when the module runs
+        namespace: dict = {}
+        exec(compile(file_content, "<test>", "exec"), namespace)
+        assert set(namespace["Ledger"].__annotations__) == {
+            "id",
+            "amount",
+            "booked_on",
+            "booked_at",
+        }
+
     def test_jsonschema_generator(self, comprehensive_schema):
         """Test JSON Schema generator"""
         generator = JsonSchemaGenerator()
@@ -198,16 +409,18 @@ class TestAllGenerators:
 
         assert schema_data["$id"] == "https://api.myapp.io/schemas/testuser.json"
 
-    def test_jsonschema_generator_schema_level_override(self, comprehensive_schema):
+    def test_jsonschema_generator_schema_level_override(
+        self, mutable_comprehensive_schema
+    ):
         """Test JSON Schema generator with schema-level base URL override"""
         generator = JsonSchemaGenerator(base_url="https://default.example.com/schemas")
 
         # Set schema-level override via metadata
-        comprehensive_schema.metadata["jsonschema"] = {
+        mutable_comprehensive_schema.metadata["jsonschema"] = {
             "base_url": "https://override.example.com/schemas"
         }
 
-        file_content = generator.generate_file(comprehensive_schema)
+        file_content = generator.generate_file(mutable_comprehensive_schema)
         schema_data = json.loads(file_content)
 
         assert (
@@ -264,7 +477,8 @@ class TestAllGenerators:
         assert "schemas" in avro_data
 
         # Find the main schema
-        main_schema = next(s for s in avro_data["schemas"] if s["name"] == "TestUser")
+        schemas_by_name = {s["name"]: s for s in avro_data["schemas"]}
+        main_schema = schemas_by_name["TestUser"]
         assert main_schema["type"] == "record"
         assert main_schema["namespace"] == "com.example.testuser"
 
@@ -288,8 +502,6 @@ class TestAllGenerators:
 
     def test_avro_null_ordering_in_optional_unions(self, comprehensive_schema):
         """Test that Avro generator always places null first in optional unions"""
-        from schema_gen.core.usr import FieldType, USRField, USRSchema
-
         generator = AvroGenerator()
 
         # Create a schema with an optional union field to test null reordering
@@ -354,16 +566,16 @@ class TestAllGenerators:
         file_content = generator.generate_file(comprehensive_schema)
         assert "package org.myapp.dto;" in file_content
 
-    def test_jackson_generator_schema_level_package(self, comprehensive_schema):
+    def test_jackson_generator_schema_level_package(self, mutable_comprehensive_schema):
         """Test Jackson generator with schema-level package override"""
         generator = JacksonGenerator(default_package="org.myapp.dto")
 
         # Set schema-level override via target_config
-        comprehensive_schema.target_config["jackson"] = {
+        mutable_comprehensive_schema.target_config["jackson"] = {
             "package": "com.override.models"
         }
 
-        file_content = generator.generate_file(comprehensive_schema)
+        file_content = generator.generate_file(mutable_comprehensive_schema)
         assert "package com.override.models;" in file_content
 
     def test_kotlin_generator(self, comprehensive_schema):
@@ -393,26 +605,22 @@ class TestAllGenerators:
         file_content = generator.generate_file(comprehensive_schema)
         assert "package org.myapp.dto" in file_content
 
-    def test_kotlin_generator_schema_level_package(self, comprehensive_schema):
+    def test_kotlin_generator_schema_level_package(self, mutable_comprehensive_schema):
         """Test Kotlin generator with schema-level package override"""
         generator = KotlinGenerator(default_package="org.myapp.dto")
 
         # Set schema-level override via target_config
-        comprehensive_schema.target_config["kotlin"] = {
+        mutable_comprehensive_schema.target_config["kotlin"] = {
             "package": "com.override.models"
         }
 
-        file_content = generator.generate_file(comprehensive_schema)
+        file_content = generator.generate_file(mutable_comprehensive_schema)
         assert "package com.override.models" in file_content
 
 
 class TestGeneratorEdgeCases:
     """Test edge cases and error handling"""
 
-    def setup_method(self):
-        """Clear registry before each test"""
-        SchemaRegistry._schemas.clear()
-
     def test_empty_schema(self):
         """Test generators with empty schema"""
 
@@ -464,17 +672,91 @@ class TestGeneratorEdgeCases:
         assert "List<String>" in kotlin_result
         assert "List<Long>" in kotlin_result
 
+    def test_generate_file_to_matches_generate_file(self):
+        """Streaming a file to a text stream yields the generate_file output"""
+
+        @Schema
+        class StreamedSchema:
+            """Schema for streamed output"""
+
+            name: str = Field(description="Name")
+            created_at: datetime | None = Field(default=None)
+
+            class Variants:
+                create_request = ["name"]
+
+        parser = SchemaParser()
+        schema = parser.parse_schema(StreamedSchema)
+
+        # TypedDict and Zod stream directly; Pydantic uses the base-class default
+        for generator in [TypedDictGenerator(), ZodGenerator(), PydanticGenerator()]:
+            buf = io.StringIO()
+            generator.generate_file_to(schema, buf)
+            assert buf.getvalue() == generator.generate_file(schema)
+
+    def test_sqlalchemy_template_compiled_once(self):
+        """SQLAlchemy generators share one compiled template"""
+        assert SqlAlchemyGenerator().template is SqlAlchemyGenerator().template
+
+    def test_template_override_is_not_shared_with_base_class(self):
+        """A subclass overriding _get_template renders its own template"""
+
+        class CustomDataclassesGenerator(DataclassesGenerator):
+            def _get_template(self) -> str:
+                return "# custom {{ class_name }}\n"
+
+        @Schema
+        class Overridden:
+            name: str = Field()
+
+        schema = SchemaParser().parse_schema(Overridden)
+
+        # Create the subclass first so its source is registered before the base
+        custom_output = CustomDataclassesGenerator().generate_model(schema)
+        base_output = DataclassesGenerator().generate_model(schema)
+
+        assert custom_output.startswith("# custom Overridden")
+        assert "# custom" not in base_output
+        assert "@dataclass" in base_output
+
+    def test_model_output_matches_file_layout(self):
+        """TypedDict and Zod models use the generate_file layout"""
+
+        @Schema
+        class PlainSchema:
+            """Schema without variants"""
+
+            name: str = Field(description="Name")
+
+        @Schema
+        class LayoutSchema:
+            """Schema with a variant"""
+
+            name: str = Field(description="Name")
+
+            class Variants:
+                create_request = ["name"]
+
+        parser = SchemaParser()
+        plain = parser.parse_schema(PlainSchema)
+        layout = parser.parse_schema(LayoutSchema)
+
+        for generator in [TypedDictGenerator(), ZodGenerator()]:
+            # Without variants, the base model is the whole generated file
+            assert generator.generate_model(plain) == generator.generate_file(plain)
+
+            variant_model = generator.generate_model(layout, "create_request")
+            assert "Generated from: LayoutSchema (create_request variant)" in (
+                variant_model
+            )
+            assert "LayoutSchemaCreateRequest" in variant_model
+
 
 class TestLiteralSupport:
     """Test literal type handling in Zod generator"""
 
-    def setup_method(self):
-        """Clear registry before each test"""
-        SchemaRegistry._schemas.clear()
-
     def test_zod_single_literal_string(self):
         """Test Zod generator produces z.literal() for single string literal"""
-        from typing import Literal
 
         @Schema
         class SingleLiteralSchema:
@@ -492,9 +774,6 @@ class TestLiteralSupport:
 
     def test_zod_multi_literal_strings(self):
         """Test Zod generator produces z.union of z.literal for multiple string literals"""
-        from typing import Literal
-
-        SchemaRegistry._schemas.clear()
 
         @Schema
         class MultiLiteralSchema:
@@ -515,9 +794,6 @@ class TestLiteralSupport:
 
     def test_zod_literal_integer(self):
         """Test Zod generator handles integer literal values without quotes"""
-        from typing import Literal
-
-        SchemaRegistry._schemas.clear()
 
         @Schema
         class IntLiteralSchema:
@@ -535,9 +811,6 @@ class TestLiteralSupport:
 
     def test_zod_multi_literal_mixed(self):
         """Test Zod generator handles mixed literal types"""
-        from typing import Literal
-
-        SchemaRegistry._schemas.clear()
 
         @Schema
         class MixedLiteralSchema:
@@ -556,17 +829,12 @@ class TestLiteralSupport:
         assert "z.enum" not in file_content
 
 
-class TestEnumSupport:
-    """Test enum support across all affected generators"""
+@pytest.fixture(scope="class")
+def enum_schema():
+    """Parse the Enum test schema once for the whole test class"""
+    from enum import Enum as PyEnum
 
-    def setup_method(self):
-        """Clear registry before each test"""
-        SchemaRegistry._schemas.clear()
-
-    @pytest.fixture
-    def enum_schema(self):
-        """Create a test schema with Enum fields"""
-        from enum import Enum as PyEnum
+    with SchemaRegistry.isolated():
 
         class Priority(PyEnum):
             LOW = "low"
@@ -586,10 +854,12 @@ class TestEnumSupport:
         parser = SchemaParser()
         return parser.parse_schema(TaskItem)
 
+
+class TestEnumSupport:
+    """Test enum support across all affected generators"""
+
     def test_enum_detected_in_usr(self, enum_schema):
         """Test that enums are correctly detected in USR"""
-        from schema_gen.core.usr import FieldType
-
         # Check the priority field
         priority_field = enum_schema.get_field("priority")
         assert priority_field is not None
@@ -651,7 +921,6 @@ class TestEnumSupport:
 
     def test_sqlalchemy_auto_now(self):
         """Test SQLAlchemy generator handles auto_now correctly"""
-        SchemaRegistry._schemas.clear()
 
         @Schema
         class TimestampModel:
@@ -706,7 +975,6 @@ class TestEnumSupport:
 
     def test_pydantic_regex_uses_pattern(self):
         """Test that Pydantic generator uses 'pattern' not 'regex'"""
-        SchemaRegistry._schemas.clear()
 
         @Schema
         class PatternModel:
@@ -726,10 +994,6 @@ class TestEnumSupport:
 class TestSetFrozensetSupport:
     """Test set and frozenset type handling across generators"""
 
-    def setup_method(self):
-        """Clear registry before each test"""
-        SchemaRegistry._schemas.clear()
-
     @pytest.fixture
     def set_schema(self):
         """Create a test schema with set and frozenset fields"""
@@ -747,8 +1011,6 @@ class TestSetFrozensetSupport:
 
     def test_usr_field_types(self, set_schema):
         """Test that set and frozenset are correctly detected in USR"""
-        from schema_gen.core.usr import FieldType
-
         tags_field = set_schema.get_field("tags")
         assert tags_field is not None
         assert tags_field.type == FieldType.SET
@@ -828,13 +1090,8 @@ class TestSetFrozensetSupport:
 class TestAnnotatedSupport:
     """Test typing.Annotated metadata extraction in TypeMapper"""
 
-    def setup_method(self):
-        """Clear registry before each test"""
-        SchemaRegistry._schemas.clear()
-
     def test_annotated_string_description(self):
         """Test that a string annotation is captured as field description"""
-        from typing import Annotated
 
         @Schema
         class AnnotatedDescSchema:
@@ -849,15 +1106,12 @@ class TestAnnotatedSupport:
         assert name_field is not None
         assert name_field.description == "User's full name"
         # Base type should be correctly resolved to STRING
-        from schema_gen.core.usr import FieldType
-
         assert name_field.type == FieldType.STRING
         # Field() constraint should still be applied
         assert name_field.min_length == 1
 
     def test_annotated_dict_metadata(self):
         """Test that a dict annotation is merged into field metadata"""
-        from typing import Annotated
 
         @Schema
         class AnnotatedDictSchema:
@@ -872,8 +1126,6 @@ class TestAnnotatedSupport:
 
         score_field = schema.get_field("score")
         assert score_field is not None
-        from schema_gen.core.usr import FieldType
-
         assert score_field.type == FieldType.INTEGER
         assert score_field.metadata["source"] == "api"
         assert score_field.metadata["deprecated"] is False
@@ -882,7 +1134,6 @@ class TestAnnotatedSupport:
 
     def test_annotated_base_type_resolution(self):
         """Test that base types are correctly resolved through Annotated"""
-        from typing import Annotated
 
         @Schema
         class AnnotatedTypesSchema:
@@ -896,8 +1147,6 @@ class TestAnnotatedSupport:
         parser = SchemaParser()
         schema = parser.parse_schema(AnnotatedTypesSchema)
 
-        from schema_gen.core.usr import FieldType
-
         assert schema.get_field("name").type == FieldType.STRING
         assert schema.get_field("age").type == FieldType.INTEGER
         assert schema.get_field("active").type == FieldType.BOOLEAN
@@ -908,7 +1157,6 @@ class TestAnnotatedSupport:
 
     def test_annotated_field_info_description_takes_precedence(self):
         """Test that Field(description=...) takes precedence over Annotated string"""
-        from typing import Annotated
 
         @Schema
         class AnnotatedPrecedenceSchema:
@@ -928,7 +1176,6 @@ class TestAnnotatedSupport:
 
     def test_annotated_combined_string_and_dict(self):
         """Test Annotated with both string and dict metadata"""
-        from typing import Annotated
 
         @Schema
         class AnnotatedCombinedSchema:
@@ -946,7 +1193,6 @@ class TestAnnotatedSupport:
 
     def test_annotated_with_optional(self):
         """Test Annotated wrapping an Optional type"""
-        from typing import Annotated
 
         @Schema
         class AnnotatedOptionalSchema:
@@ -964,7 +1210,6 @@ class TestAnnotatedSupport:
 
     def test_annotated_constraint_object(self):
         """Test that constraint objects in Annotated are extracted"""
-        from typing import Annotated
 
         class MinMax:
             """Simple constraint descriptor"""
@@ -989,7 +1234,6 @@ class TestAnnotatedSupport:
 
     def test_annotated_field_constraints_take_precedence_over_annotated_object(self):
         """Test that Field() constraints take precedence over Annotated constraint objects"""
-        from typing import Annotated
 
         class MinMax:
             """Simple constraint descriptor"""
@@ -1016,7 +1260,6 @@ class TestAnnotatedSupport:
 
     def test_annotated_generates_valid_pydantic(self):
         """Test that Annotated schemas generate valid Pydantic output"""
-        from typing import Annotated
 
         @Schema
         class AnnotatedPydanticSchema:
@@ -1043,10 +1286,6 @@ class TestAnnotatedSupport:
 
     def test_python_type_to_usr_handles_annotated(self):
         """Test TypeMapper.python_type_to_usr directly with Annotated types"""
-        from typing import Annotated
-
-        from schema_gen.core.usr import FieldType, TypeMapper
-
         assert TypeMapper.python_type_to_usr(Annotated[str, "desc"]) == FieldType.STRING
         assert (
             TypeMapper.python_type_to_usr(Annotated[int, {"x": 1}]) == FieldType.INTEGER
@@ -1060,76 +1299,67 @@ class TestAnnotatedSupport:
         )
 
 
-class TestTupleSupport:
-    """Test tuple type handling across generators"""
-
-    def setup_method(self):
-        """Clear registry before each test"""
-        SchemaRegistry._schemas.clear()
-
-    def _make_tuple_schema(self):
-        """Create a USR schema with tuple fields directly (bypassing @Schema decorator)"""
-        from schema_gen.core.usr import FieldType, USRField, USRSchema
+@pytest.fixture(scope="class")
+def tuple_schema():
+    """Build the tuple-field USR schema once per class (bypassing @Schema)"""
+    # coordinates: tuple[float, float]
+    coord_inner_0 = USRField(
+        name="coordinates_0", type=FieldType.FLOAT, python_type=float
+    )
+    coord_inner_1 = USRField(
+        name="coordinates_1", type=FieldType.FLOAT, python_type=float
+    )
+    coordinates_field = USRField(
+        name="coordinates",
+        type=FieldType.TUPLE,
+        python_type=tuple,
+        union_types=[coord_inner_0, coord_inner_1],
+        description="Lat/Lon pair",
+    )
+
+    # record: tuple[str, int, bool]
+    rec_inner_0 = USRField(name="record_0", type=FieldType.STRING, python_type=str)
+    rec_inner_1 = USRField(name="record_1", type=FieldType.INTEGER, python_type=int)
+    rec_inner_2 = USRField(name="record_2", type=FieldType.BOOLEAN, python_type=bool)
+    record_field = USRField(
+        name="record",
+        type=FieldType.TUPLE,
+        python_type=tuple,
+        union_types=[rec_inner_0, rec_inner_1, rec_inner_2],
+        description="A heterogeneous record",
+    )
+
+    return USRSchema(
+        name="TupleTest",
+        fields=[coordinates_field, record_field],
+        description="Schema with tuple fields",
+    )
 
-        # coordinates: tuple[float, float]
-        coord_inner_0 = USRField(
-            name="coordinates_0", type=FieldType.FLOAT, python_type=float
-        )
-        coord_inner_1 = USRField(
-            name="coordinates_1", type=FieldType.FLOAT, python_type=float
-        )
-        coordinates_field = USRField(
-            name="coordinates",
-            type=FieldType.TUPLE,
-            python_type=tuple,
-            union_types=[coord_inner_0, coord_inner_1],
-            description="Lat/Lon pair",
-        )
 
-        # record: tuple[str, int, bool]
-        rec_inner_0 = USRField(name="record_0", type=FieldType.STRING, python_type=str)
-        rec_inner_1 = USRField(name="record_1", type=FieldType.INTEGER, python_type=int)
-        rec_inner_2 = USRField(
-            name="record_2", type=FieldType.BOOLEAN, python_type=bool
-        )
-        record_field = USRField(
-            name="record",
-            type=FieldType.TUPLE,
-            python_type=tuple,
-            union_types=[rec_inner_0, rec_inner_1, rec_inner_2],
-            description="A heterogeneous record",
-        )
-
-        return USRSchema(
-            name="TupleTest",
-            fields=[coordinates_field, record_field],
-            description="Schema with tuple fields",
-        )
+class TestTupleSupport:
+    """Test tuple type handling across generators"""
 
-    def test_pydantic_tuple(self):
+    def test_pydantic_tuple(self, tuple_schema):
         """Test Pydantic generator produces tuple[float, float] and tuple[str, int, bool]"""
-        schema = self._make_tuple_schema()
         generator = PydanticGenerator()
-        file_content = generator.generate_file(schema)
+        file_content = generator.generate_file(tuple_schema)
 
         assert "tuple[float, float]" in file_content
         assert "tuple[str, int, bool]" in file_content
         compile(file_content, "<test>", "exec")
 
-    def test_zod_tuple(self):
+    def test_zod_tuple(self, tuple_schema):
         """Test Zod generator produces z.tuple([z.number(), z.number()])"""
-        schema = self._make_tuple_schema()
         generator = ZodGenerator()
-        file_content = generator.generate_file(schema)
+        file_content = generator.generate_file(tuple_schema)
 
         assert "z.tuple([z.number(), z.number()])" in file_content
         assert "z.tuple([z.string(), z.number().int(), z.boolean()])" in file_content
 
-    def test_jsonschema_tuple(self):
+    def test_jsonschema_tuple(self, tuple_schema):
         """Test JSON Schema generator produces prefixItems"""
-        schema = self._make_tuple_schema()
         generator = JsonSchemaGenerator()
-        file_content = generator.generate_file(schema)
+        file_content = generator.generate_file(tuple_schema)
 
         schema_data = json.loads(file_content)
         tuple_test = schema_data["$defs"]["TupleTest"]
@@ -1152,94 +1382,87 @@ class TestTupleSupport:
         assert record_prop["prefixItems"][2]["type"] == "boolean"
         assert record_prop["items"] is False
 
-    def test_kotlin_tuple(self):
+    def test_kotlin_tuple(self, tuple_schema):
         """Test Kotlin generates Pair<Double, Double> for 2-element tuple"""
-        schema = self._make_tuple_schema()
         generator = KotlinGenerator()
-        file_content = generator.generate_file(schema)
+        file_content = generator.generate_file(tuple_schema)
 
         assert "Pair<Double, Double>" in file_content
         # 3-element tuple should use Triple
         assert "Triple<String, Long, Boolean>" in file_content
 
-    def test_dataclasses_tuple(self):
+    def test_dataclasses_tuple(self, tuple_schema):
         """Test Dataclasses generator produces tuple[float, float]"""
-        schema = self._make_tuple_schema()
         generator = DataclassesGenerator()
-        file_content = generator.generate_file(schema)
+        file_content = generator.generate_file(tuple_schema)
 
         assert "tuple[float, float]" in file_content
         assert "tuple[str, int, bool]" in file_content
         compile(file_content, "<test>", "exec")
 
-    def test_typeddict_tuple(self):
+    def test_typeddict_tuple(self, tuple_schema):
         """Test TypedDict generator produces tuple[float, float]"""
-        schema = self._make_tuple_schema()
         generator = TypedDictGenerator()
-        file_content = generator.generate_file(schema)
+        file_content = generator.generate_file(tuple_schema)
 
         assert "tuple[float, float]" in file_content
         assert "tuple[str, int, bool]" in file_content
         compile(file_content, "<test>", "exec")
 
-    def test_sqlalchemy_tuple(self):
+    def test_sqlalchemy_tuple(self, tuple_schema):
         """Test SQLAlchemy generator uses JSON for tuple fields"""
-        schema = self._make_tuple_schema()
         generator = SqlAlchemyGenerator()
-        file_content = generator.generate_file(schema)
+        file_content = generator.generate_file(tuple_schema)
 
         assert "JSON" in file_content
 
-    def test_jackson_tuple(self):
+    def test_jackson_tuple(self, tuple_schema):
         """Test Jackson generator uses List<Object> for tuple fields"""
-        schema = self._make_tuple_schema()
         generator = JacksonGenerator()
-        file_content = generator.generate_file(schema)
+        file_content = generator.generate_file(tuple_schema)
 
         assert "List<Object>" in file_content
 
-    def test_pathway_tuple(self):
+    def test_pathway_tuple(self, tuple_schema):
         """Test Pathway generator uses tuple comment"""
-        schema = self._make_tuple_schema()
         generator = PathwayGenerator()
-        file_content = generator.generate_file(schema)
+        file_content = generator.generate_file(tuple_schema)
 
         assert "pw.ColumnExpression  # tuple" in file_content
 
 
-class TestSelfReferentialTypes:
-    """Test self-referential (recursive) type support across generators"""
-
-    @pytest.fixture
-    def tree_node_schema(self):
-        """Create a USRSchema representing a self-referential tree node"""
-        from schema_gen.core.usr import FieldType, USRField, USRSchema
-
-        return USRSchema(
-            name="TreeNode",
-            fields=[
-                USRField(name="value", type=FieldType.STRING, python_type=str),
-                USRField(
-                    name="children",
-                    type=FieldType.LIST,
-                    python_type=list,
-                    inner_type=USRField(
-                        name="children_item",
-                        type=FieldType.NESTED_SCHEMA,
-                        python_type=object,
-                        nested_schema="TreeNode",
-                    ),
-                ),
-                USRField(
-                    name="parent",
+@pytest.fixture(scope="class")
+def tree_node_schema():
+    """Build a self-referential tree node USRSchema once per class"""
+    return USRSchema(
+        name="TreeNode",
+        fields=[
+            USRField(name="value", type=FieldType.STRING, python_type=str),
+            USRField(
+                name="children",
+                type=FieldType.LIST,
+                python_type=list,
+                inner_type=USRField(
+                    name="children_item",
                     type=FieldType.NESTED_SCHEMA,
                     python_type=object,
                     nested_schema="TreeNode",
-                    optional=True,
                 ),
-            ],
-            description="A tree node with recursive children",
-        )
+            ),
+            USRField(
+                name="parent",
+                type=FieldType.NESTED_SCHEMA,
+                python_type=object,
+                nested_schema="TreeNode",
+                optional=True,
+            ),
+        ],
+        description="A tree node with recursive children",
+    )
+
+
+class TestSelfReferentialTypes:
+    """Test self-referential (recursive) type support across generators"""
 
     def test_get_self_referencing_fields(self, tree_node_schema):
         """Test that get_self_referencing_fields correctly identifies self-referential fields"""
@@ -1254,8 +1477,6 @@ class TestSelfReferentialTypes:
 
     def test_get_self_referencing_fields_no_self_ref(self):
         """Test that get_self_referencing_fields returns empty for non-recursive schemas"""
-        from schema_gen.core.usr import FieldType, USRField, USRSchema
-
         schema = USRSchema(
             name="Simple",
             fields=[
@@ -1302,8 +1523,6 @@ class TestSelfReferentialTypes:
 
     def test_jsonschema_cross_file_ref(self):
         """Test that JSON Schema $ref points to external file for cross-file nested types"""
-        from schema_gen.core.usr import FieldType, USRField, USRSchema
-
         # SignalLeg is defined in a separate schema file
         signal_leg_schema = USRSchema(
             name="SignalLeg",
@@ -1397,8 +1616,6 @@ class TestSelfReferentialTypes:
 
         from schema_gen.core.config import Config
 
-        SchemaRegistry._schemas.clear()
-
         @Schema
         class EventTimes:
             """Schema with date and time fields"""
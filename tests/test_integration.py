@@ -1,15 +1,12 @@
 """Integration tests for end-to-end schema generation"""
 
-import tempfile
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
 from schema_gen import Field, Schema
 from schema_gen.core.config import Config
 from schema_gen.core.generator import SchemaGenerationEngine
-from schema_gen.core.schema import SchemaRegistry
 from schema_gen.generators.pydantic_generator import PydanticGenerator
 from schema_gen.parsers.schema_parser import SchemaParser
 
@@ -17,10 +14,6 @@ from schema_gen.parsers.schema_parser import SchemaParser
 class TestEndToEndGeneration:
     """Test complete schema generation workflow"""
 
-    def setup_method(self):
-        """Clear registry before each test"""
-        SchemaRegistry._schemas.clear()
-
     def test_complete_pydantic_generation_workflow(self):
         """Test the complete workflow from schema definition to Pydantic generation"""
 
@@ -99,26 +92,22 @@ class TestEndToEndGeneration:
             assert "from pydantic import BaseModel" in model_code
             compile(model_code, f"<{variant_name}>", "exec")
 
-    def test_schema_generation_engine_with_config(self):
+    def test_schema_generation_engine_with_config(self, tmp_path):
         """Test the complete generation engine with configuration"""
 
-        # Create a temporary directory for testing
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create configuration
-            config = Config(
-                input_dir=str(temp_path / "schemas"),
-                output_dir=str(temp_path / "generated"),
-                targets=["pydantic"],
-            )
+        # Create configuration
+        config = Config(
+            input_dir=str(tmp_path / "schemas"),
+            output_dir=str(tmp_path / "generated"),
+            targets=["pydantic"],
+        )
 
-            # Create schema directory and file
-            schema_dir = temp_path / "schemas"
-            schema_dir.mkdir()
+        # Create schema directory and file
+        schema_dir = tmp_path / "schemas"
+        schema_dir.mkdir()
 
-            schema_file = schema_dir / "test_schema.py"
-            schema_content = '''
+        schema_file = schema_dir / "test_schema.py"
+        schema_content = '''
 from schema_gen import Schema, Field
 from typing import Optional
 
@@ -132,29 +121,56 @@ class TestModel:
         create = ['name', 'value']
         response = ['name', 'value']
 '''
-            schema_file.write_text(schema_content)
+        schema_file.write_text(schema_content)
+
+        # Create generation engine
+        engine = SchemaGenerationEngine(config)
+
+        # Load schemas and generate
+        engine.load_schemas_from_directory()
+        engine.generate_all()
+
+        # Verify output files exist
+        output_dir = tmp_path / "generated" / "pydantic"
+        assert output_dir.exists()
+        assert (output_dir / "testmodel_models.py").exists()
+        assert (output_dir / "__init__.py").exists()
+
+        # Verify generated content
+        models_file = output_dir / "testmodel_models.py"
+        generated_content = models_file.read_text()
+
+        assert "class TestModel(BaseModel):" in generated_content
+        assert "class TestModelCreate(BaseModel):" in generated_content
+        assert "class TestModelResponse(BaseModel):" in generated_content
+        assert "AUTO-GENERATED FILE" in generated_content
+
+    def test_failed_generation_keeps_previous_file(self, tmp_path, monkeypatch):
+        """A generator error leaves the existing output file untouched"""
+
+        @Schema
+        class Kept:
+            name: str = Field()
 
-            # Create generation engine
-            engine = SchemaGenerationEngine(config)
+        config = Config(output_dir=str(tmp_path), targets=["pydantic"])
+        engine = SchemaGenerationEngine(config)
+        schema = engine.parser.parse_schema(Kept)
+        target_dir = tmp_path / "pydantic"
+        target_dir.mkdir()
+        previous = target_dir / "kept_models.py"
+        previous.write_text("# previous output\n")
 
-            # Load schemas and generate
-            engine.load_schemas_from_directory()
-            engine.generate_all()
+        def fail(schema, out):
+            out.write("# partial")
+            raise RuntimeError("generator failed")
 
-            # Verify output files exist
-            output_dir = temp_path / "generated" / "pydantic"
-            assert output_dir.exists()
-            assert (output_dir / "testmodel_models.py").exists()
-            assert (output_dir / "__init__.py").exists()
+        monkeypatch.setattr(engine.generators["pydantic"], "generate_file_to", fail)
 
-            # Verify generated content
-            models_file = output_dir / "testmodel_models.py"
-            generated_content = models_file.read_text()
+        with pytest.raises(RuntimeError, match="generator failed"):
+            engine._generate_target("pydantic", [schema], tmp_path)
 
-            assert "class TestModel(BaseModel):" in generated_content
-            assert "class TestModelCreate(BaseModel):" in generated_content
-            assert "class TestModelResponse(BaseModel):" in generated_content
-            assert "AUTO-GENERATED FILE" in generated_content
+        assert previous.read_text() == "# previous output\n"
+        assert sorted(p.name for p in target_dir.iterdir()) == ["kept_models.py"]
 
     def test_complex_schema_with_relationships(self):
         """Test schema with complex relationships and types"""
@@ -19,7 +19,6 @@ produced an empty list.
 from enum import Enum
 
 from schema_gen import Field, Schema
-from schema_gen.core.schema import SchemaRegistry
 from schema_gen.generators.jsonschema_generator import JsonSchemaGenerator
 from schema_gen.generators.pydantic_generator import PydanticGenerator
 from schema_gen.generators.zod_generator import ZodGenerator
@@ -29,9 +28,6 @@ from schema_gen.parsers.schema_parser import SchemaParser
 class TestOptionalEnumDiscovery:
     """Issue #15: enums referenced through wrapper types must emit members."""
 
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -5,7 +5,6 @@ instead of Option<Vec<String>> / z.array(z.string()).optional().
 """
 
 from schema_gen import Field, Schema
-from schema_gen.core.schema import SchemaRegistry
 from schema_gen.core.usr import FieldType
 from schema_gen.generators.jsonschema_generator import JsonSchemaGenerator
 from schema_gen.generators.pydantic_generator import PydanticGenerator
@@ -17,9 +16,6 @@ from schema_gen.parsers.schema_parser import SchemaParser
 class TestOptionalListNesting:
     """Issue #64: Optional[list[T]] must NOT produce double-nested arrays."""
 
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def _make_schema(self):
         @Schema
         class Container:
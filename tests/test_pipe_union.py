@@ -47,7 +47,6 @@ class _PipeDiscriminatedHolder:
 
 
 def _parse(cls):
-    SchemaRegistry._schemas.clear()
     for c in (
         _PipeSchemaA,
         _PipeSchemaB,
@@ -1,7 +1,8 @@
 """Tests for production readiness fixes."""
 
+import contextlib
+import shutil
 import tempfile
-import warnings
 from pathlib import Path
 
 import pytest
@@ -18,9 +19,6 @@ from schema_gen.parsers.schema_parser import SchemaParser
 class TestValidationInParser:
     """Task 1: Validation is wired up in the parser."""
 
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_invalid_variant_field_reference_raises(self):
         """Schema with a variant referencing a nonexistent field raises ValueError."""
 
@@ -44,15 +42,47 @@ class TestValidationInParser:
             name: str = Field()
 
         parser = SchemaParser()
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        with pytest.warns(UserWarning, match="primary_key.*optional"):
             result = parser.parse_schema(OptionalPK)
 
         assert result.name == "OptionalPK"
-        warning_messages = [str(warning.message) for warning in w]
-        assert any(
-            "primary_key" in msg and "optional" in msg for msg in warning_messages
-        )
+
+    def test_parse_schema_is_cached_until_invalidated(self):
+        """Repeated parses return the cached USRSchema until invalidate()."""
+
+        @Schema
+        class Cached:
+            name: str = Field()
+
+        parser = SchemaParser()
+        first = parser.parse_schema(Cached)
+        assert parser.parse_schema(Cached) is first
+        assert parser.parse_all_schemas() == [first]
+
+        parser.invalidate()
+        rebuilt = parser.parse_schema(Cached)
+        assert rebuilt is not first
+        assert rebuilt == first
+
+    def test_variants_sorted_and_inherited(self):
+        """Variants come back sorted by name, including inherited ones."""
+
+        class BaseVariants:
+            summary = ["name"]
+
+        @Schema
+        class WithVariants:
+            name: str = Field()
+            age: int = Field()
+
+            class Variants(BaseVariants):
+                full = ["name", "age"]
+                _private = ["age"]
+                not_a_variant = "name"
+
+        schema = SchemaParser().parse_schema(WithVariants)
+        assert schema.variants == {"full": ["name", "age"], "summary": ["name"]}
+        assert list(schema.variants) == ["full", "summary"]
 
     def test_parse_all_schemas_collects_errors(self):
         """parse_all_schemas collects errors from multiple schemas."""
@@ -73,6 +103,31 @@ class TestValidationInParser:
             parser.parse_all_schemas()
 
 
+class TestSchemaRegistryIsolation:
+    """SchemaRegistry.isolated() gives a block its own registry."""
+
+    def test_isolated_registry_restores_previous_schemas(self):
+        """Schemas registered inside the block are dropped on exit."""
+        with SchemaRegistry.isolated():
+
+            @Schema
+            class Outer:
+                name: str = Field()
+
+            with SchemaRegistry.isolated():
+                assert SchemaRegistry.get_all_schemas() == {}
+
+                @Schema
+                class Inner:
+                    name: str = Field()
+
+                assert set(SchemaRegistry.get_all_schemas()) == {"Inner"}
+
+            assert set(SchemaRegistry.get_all_schemas()) == {"Outer"}
+
+        assert SchemaRegistry.get_schema("Outer") is None
+
+
 class TestConfigErrorHandling:
     """Task 2: Config errors are no longer silently swallowed."""
 
@@ -82,36 +137,33 @@ class TestConfigErrorHandling:
         assert config.targets == ["pydantic"]
 
     def test_config_with_syntax_error_raises(self):
-        """Config file with syntax error raises SyntaxError."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("config = Config(\n")  # unclosed paren
-            f.flush()
-            with pytest.raises(SyntaxError, match=f.name):
-                Config.from_file(f.name)
+        """Config source with syntax error raises SyntaxError."""
+        with pytest.raises(SyntaxError, match="/virt/syntax.py"):
+            Config._from_source("config = Config(\n", "/virt/syntax.py")
 
     def test_config_without_config_variable_raises(self):
-        """Config file without 'config' variable raises ValueError."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("x = 42\n")
-            f.flush()
-            with pytest.raises(ValueError, match="must define a 'config' variable"):
-                Config.from_file(f.name)
+        """Config source without 'config' variable raises ValueError."""
+        with pytest.raises(ValueError, match="must define a 'config' variable"):
+            Config._from_source("x = 42\n", "/virt/no_config.py")
 
     def test_config_with_import_error_raises(self):
-        """Config file with ImportError re-raises with file path."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("import nonexistent_module_xyz\n")
-            f.flush()
-            with pytest.raises(ModuleNotFoundError):
-                Config.from_file(f.name)
+        """Config source with ImportError re-raises with file path."""
+        with pytest.raises(ModuleNotFoundError, match="/virt/bad_import.py"):
+            Config._from_source(
+                "import nonexistent_module_xyz\n", "/virt/bad_import.py"
+            )
+
+    def test_config_file_errors_report_file_path(self, tmp_path):
+        """from_file executes the file and reports its path in errors."""
+        config_file = tmp_path / "broken.config.py"
+        config_file.write_text("x = 42\n")
+        with pytest.raises(ValueError, match="broken.config.py"):
+            Config.from_file(str(config_file))
 
 
 class TestInvalidTargetsAndVariants:
     """Task 3: Invalid targets and missing variants fail loudly."""
 
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_invalid_target_name_raises(self):
         """Config with unknown target raises ValueError."""
         config = Config(targets=["nonexistent_target"])
@@ -154,13 +206,20 @@ class TestInvalidTargetsAndVariants:
         assert len(result) == 1
         assert result[0].name == "id"
 
+    def test_variant_class_name_is_pascal_case(self):
+        """get_variant_class_name joins the schema name and PascalCase variant."""
+        schema = USRSchema(
+            name="User",
+            fields=[USRField(name="id", type=FieldType.INTEGER, python_type=int)],
+            variants={"create_request": ["id"]},
+        )
+        assert schema.get_variant_class_name("create_request") == "UserCreateRequest"
+        assert schema.variant_class_names == {"create_request": "CreateRequest"}
+
 
 class TestSchemaImportError:
     """Task 4: Schema import errors are raised, not swallowed."""
 
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_broken_schema_file_raises(self):
         """A schema file with a syntax error raises SchemaImportError."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -173,76 +232,89 @@ class TestSchemaImportError:
             with pytest.raises(SchemaImportError, match="broken.py"):
                 engine.load_schemas_from_directory()
 
+    def test_reloading_schema_directory_does_not_grow_parser_cache(self, tmp_path):
+        """Loading the same directory twice keeps one cache entry per schema."""
+        (tmp_path / "reloaded.py").write_text(
+            "from schema_gen import Field, Schema\n"
+            "\n"
+            "@Schema\n"
+            "class Reloaded:\n"
+            "    name: str = Field()\n"
+        )
+        engine = SchemaGenerationEngine(Config(input_dir=str(tmp_path)))
+
+        engine.load_schemas_from_directory()
+        first = engine.parser.parse_all_schemas()
+        assert len(engine.parser._cache) == 1
+
+        engine.load_schemas_from_directory()
+        second = engine.parser.parse_all_schemas()
+        assert len(engine.parser._cache) == 1
+        assert second[0] is not first[0]
+        assert second == first
+
+
+@pytest.fixture(scope="module")
+def generated_project(tmp_path_factory):
+    """A project after ``init`` and ``generate``, built once per module."""
+    project = tmp_path_factory.mktemp("project")
+    runner = CliRunner()
+    with contextlib.chdir(project), SchemaRegistry.isolated():
+        runner.invoke(main, ["init"])
+        result = runner.invoke(main, ["generate"])
+    assert result.exit_code == 0, result.output
+    return project
+
 
 class TestValidateCommand:
     """Task 5: validate command does real content comparison."""
 
     def setup_method(self):
-        SchemaRegistry._schemas.clear()
         self.runner = CliRunner()
 
-    def test_validate_up_to_date(self):
-        """Generate then validate passes."""
-        with self.runner.isolated_filesystem():
-            # Init project
-            self.runner.invoke(main, ["init"])
-
-            # Generate
-            result = self.runner.invoke(main, ["generate"])
-            assert result.exit_code == 0, result.output
+    @pytest.fixture
+    def project(self, generated_project, tmp_path, monkeypatch):
+        """Private copy of the generated project as the working directory."""
+        project = tmp_path / "project"
+        shutil.copytree(generated_project, project)
+        monkeypatch.chdir(project)
+        return project
 
-            # Validate
-            SchemaRegistry._schemas.clear()
-            result = self.runner.invoke(main, ["validate"])
-            assert result.exit_code == 0, result.output
-            assert "up-to-date" in result.output
+    def test_validate_up_to_date(self, project):
+        """Generate then validate passes."""
+        result = self.runner.invoke(main, ["validate"])
+        assert result.exit_code == 0, result.output
+        assert "up-to-date" in result.output
 
-    def test_validate_stale_files(self):
+    def test_validate_stale_files(self, project):
         """Modifying a generated file makes validate fail."""
-        with self.runner.isolated_filesystem():
-            # Init and generate
-            self.runner.invoke(main, ["init"])
-            result = self.runner.invoke(main, ["generate"])
-            assert result.exit_code == 0, result.output
-
-            # Tamper with a generated file
-            gen_dir = Path("generated/pydantic")
-            py_files = list(gen_dir.glob("*_models.py"))
-            assert py_files, "Expected generated model files"
-            py_files[0].write_text("# tampered\n")
-
-            # Validate should fail
-            SchemaRegistry._schemas.clear()
-            result = self.runner.invoke(main, ["validate"])
-            assert result.exit_code != 0, result.output
-            assert "OUT-OF-DATE" in result.output
-
-    def test_validate_missing_target_dir(self):
+        # Tamper with a generated file
+        gen_dir = project / "generated" / "pydantic"
+        py_files = list(gen_dir.glob("*_models.py"))
+        assert py_files, "Expected generated model files"
+        py_files[0].write_text("# tampered\n")
+
+        # Validate should fail
+        result = self.runner.invoke(main, ["validate"])
+        assert result.exit_code != 0, result.output
+        assert "OUT-OF-DATE" in result.output
+
+    def test_validate_missing_target_dir(self, project):
         """Validate fails when target directory is missing."""
-        with self.runner.isolated_filesystem():
-            # Init and generate
-            self.runner.invoke(main, ["init"])
-            result = self.runner.invoke(main, ["generate"])
-            assert result.exit_code == 0, result.output
-
-            # Remove target dir
-            import shutil
-
-            shutil.rmtree("generated/pydantic")
+        shutil.rmtree(project / "generated" / "pydantic")
 
-            # Validate should fail
-            SchemaRegistry._schemas.clear()
-            result = self.runner.invoke(main, ["validate"])
-            assert result.exit_code != 0, result.output
+        # Validate should fail
+        result = self.runner.invoke(main, ["validate"])
+        assert result.exit_code != 0, result.output
 
-    def test_validate_no_output_dir(self):
+    def test_validate_no_output_dir(self, tmp_path, monkeypatch):
         """Validate fails when output directory doesn't exist."""
-        with self.runner.isolated_filesystem():
-            self.runner.invoke(main, ["init"])
+        monkeypatch.chdir(tmp_path)
+        self.runner.invoke(main, ["init"])
 
-            # Don't generate - just validate
-            result = self.runner.invoke(main, ["validate"])
-            assert result.exit_code != 0
+        # Don't generate - just validate
+        result = self.runner.invoke(main, ["validate"])
+        assert result.exit_code != 0
 
 
 class TestPreCommitConfig:
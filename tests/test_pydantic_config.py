@@ -25,7 +25,6 @@ from schema_gen.parsers.schema_parser import SchemaParser
 
 def _make_schema():
     """Build a small schema that triggers the model_config emission path."""
-    SchemaRegistry._schemas.clear()
 
     @Schema
     class ConfigTestModel:
@@ -202,8 +201,6 @@ class TestEngineThreadsConfigEndToEnd:
     """Full path: SchemaGenerationEngine -> PydanticGenerator -> file output."""
 
     def test_engine_passes_pydantic_config_to_generator(self, tmp_path):
-        SchemaRegistry._schemas.clear()
-
         @Schema
         class EngineTestModel:
             """Schema for end-to-end engine test."""
@@ -272,9 +269,6 @@ class TestPydanticEnumMeta:
     """PydanticMeta on Enum classes injects domain methods into the
     generated Pydantic enum body."""
 
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_enum_pydantic_meta_methods(self):
         from schema_gen.generators.pydantic_generator import PydanticGenerator
 
@@ -323,7 +317,6 @@ class TestPydanticDiscriminatedUnion:
     for discriminated union fields."""
 
     def setup_method(self):
-        SchemaRegistry._schemas.clear()
         for cls in (_PydCeLeg, _PydPeLeg, _PydDiscOrder):
             SchemaRegistry.register(cls)
 
@@ -370,9 +363,6 @@ class TestPydanticDefaultFactory:
     """Pydantic generator must emit Field(default_factory=...) when the
     USRField has a default_factory set, instead of Field(...) (required)."""
 
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_default_factory_list(self):
         usr = SchemaParser().parse_schema(_DefaultFactoryModel)
         out = PydanticGenerator().generate_file(usr)
@@ -19,7 +19,6 @@ from __future__ import annotations
 from enum import Enum
 
 from schema_gen import Field, Schema
-from schema_gen.core.schema import SchemaRegistry
 from schema_gen.generators.pydantic_generator import PydanticGenerator
 from schema_gen.parsers.schema_parser import SchemaParser
 
@@ -36,7 +35,6 @@ class _TradeMode(str, Enum):
 
 
 def _generate(cls) -> str:
-    SchemaRegistry._schemas.clear()
     schema = SchemaParser().parse_schema(cls)
     return PydanticGenerator().generate_file(schema)
 
@@ -206,8 +204,6 @@ class TestMultiLineClassDocstring:
         """The Jinja template path must also emit PEP 257 multi-line form."""
         from schema_gen.generators.pydantic_generator import PydanticGenerator
 
-        SchemaRegistry._schemas.clear()
-
         @Schema
         class WithMultiLine:
             """Summary line for model.
@@ -236,8 +232,6 @@ class TestMultiLineClassDocstring:
 
         from schema_gen.generators.pydantic_generator import PydanticGenerator
 
-        SchemaRegistry._schemas.clear()
-
         @Schema
         class HasMode:
             mode: _TradeMode = Field(default=_TradeMode.LIVE)
@@ -261,8 +255,6 @@ class TestTypingImportsViaGenerateModel:
     def test_optional_only_via_generate_model(self):
         from schema_gen.generators.pydantic_generator import PydanticGenerator
 
-        SchemaRegistry._schemas.clear()
-
         @Schema
         class OptionalOnly:
             nickname: str | None = Field(default=None)
@@ -277,8 +269,6 @@ class TestTypingImportsViaGenerateModel:
     def test_no_typing_via_generate_model(self):
         from schema_gen.generators.pydantic_generator import PydanticGenerator
 
-        SchemaRegistry._schemas.clear()
-
         @Schema
         class NoTyping:
             name: str = Field(...)
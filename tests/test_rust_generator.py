@@ -66,9 +66,6 @@ class _Customer:
 class TestRustGenerator:
     """String-level assertions mirroring ``tests/test_generators.py``."""
 
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     # ------------------------------------------------------------------
     # 1. Simple struct
     # ------------------------------------------------------------------
@@ -513,8 +510,6 @@ def test_engine_writes_lib_rs_not_init_py(tmp_path):
     from schema_gen.core.config import Config
     from schema_gen.core.generator import SchemaGenerationEngine
 
-    SchemaRegistry._schemas.clear()
-
     @Schema
     class EngineFixOrder:
         id: int
@@ -732,7 +727,6 @@ def test_engine_emits_common_rs_and_dedups_enums(tmp_path):
     from schema_gen.core.config import Config
     from schema_gen.core.generator import SchemaGenerationEngine
 
-    SchemaRegistry._schemas.clear()
     SchemaRegistry.register(OrderAlphaForC1)
     SchemaRegistry.register(OrderBetaForC1)
 
@@ -770,7 +764,6 @@ def test_engine_emits_cross_module_use_for_nested_schema(tmp_path):
     from schema_gen.core.config import Config
     from schema_gen.core.generator import SchemaGenerationEngine
 
-    SchemaRegistry._schemas.clear()
     SchemaRegistry.register(PositionLegForC2)
     SchemaRegistry.register(PositionForC2)
 
@@ -791,7 +784,6 @@ def test_engine_emits_cargo_toml(tmp_path):
     from schema_gen.core.config import Config
     from schema_gen.core.generator import SchemaGenerationEngine
 
-    SchemaRegistry._schemas.clear()
     SchemaRegistry.register(_CargoTest)
 
     out_dir = tmp_path / "out"
@@ -818,7 +810,6 @@ def test_engine_cargo_toml_overrides(tmp_path):
     from schema_gen.core.config import Config
     from schema_gen.core.generator import SchemaGenerationEngine
 
-    SchemaRegistry._schemas.clear()
     SchemaRegistry.register(_CargoTest)
 
     out_dir = tmp_path / "out"
@@ -846,7 +837,6 @@ def test_engine_cargo_toml_can_be_disabled(tmp_path):
     from schema_gen.core.config import Config
     from schema_gen.core.generator import SchemaGenerationEngine
 
-    SchemaRegistry._schemas.clear()
     SchemaRegistry.register(_CargoTest)
 
     out_dir = tmp_path / "out"
@@ -869,9 +859,6 @@ def test_engine_cargo_toml_can_be_disabled(tmp_path):
 class TestRustWidthOverride:
     """Field(rust={"type": "u32"}) controls Rust integer / float widths."""
 
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_integer_width_override_u32(self):
         @Schema
         class OrderRequest:
@@ -1032,9 +1019,6 @@ class TestRustEnumMeta:
     """SerdeMeta on Enum classes injects extra derives + raw_code impl
     blocks into the generated Rust enum."""
 
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_enum_serde_meta_raw_code(self):
         usr = SchemaParser().parse_schema(_OrderEnumHolder)
         out = RustGenerator().generate_file(usr)
@@ -1067,7 +1051,6 @@ class TestRustEnumMeta:
         from schema_gen.core.config import Config
         from schema_gen.core.generator import SchemaGenerationEngine
 
-        SchemaRegistry._schemas.clear()
         SchemaRegistry.register(_Mode2Holder)
 
         out_dir = tmp_path / "out"
@@ -1128,10 +1111,9 @@ class TestRustDiscriminatedUnion:
     """Annotated[Union[A, B], Field(discriminator="...")] → serde tagged enum."""
 
     def setup_method(self):
-        # Other test classes wipe SchemaRegistry in their setup_method, so
+        # Each test starts with an empty registry (tests/conftest.py), so
         # re-register the variant @Schema classes the parser needs to look
         # up to resolve Literal tags.
-        SchemaRegistry._schemas.clear()
         for cls in (
             _CeLeg,
             _PeLeg,
@@ -1239,7 +1221,6 @@ class TestDiscriminatorErrors:
     fall back to plain Union / serde_json::Value."""
 
     def setup_method(self):
-        SchemaRegistry._schemas.clear()
         for cls in (
             _DiscErrAVariant,
             _DiscErrBVariant,
@@ -1282,9 +1263,6 @@ class TestNonSnakeCaseFieldRename:
     ``#[serde(rename = "<original>")]`` attribute so the JSON wire format is
     preserved while the Rust code stays ``non_snake_case``-warning-free."""
 
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def test_uppercase_acronym_in_snake_field_gets_rename(self):
         """Embedded uppercase acronym (CE, PE) → rename + lowercased ident."""
 
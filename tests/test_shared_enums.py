@@ -10,7 +10,6 @@ from enum import Enum
 from pathlib import Path
 
 from schema_gen import Field, Schema
-from schema_gen.core.schema import SchemaRegistry
 from schema_gen.generators.pydantic_generator import PydanticGenerator
 from schema_gen.parsers.schema_parser import SchemaParser
 
@@ -18,9 +17,6 @@ from schema_gen.parsers.schema_parser import SchemaParser
 class TestSharedEnums:
     """Issue #43: shared enums must live in _enums.py, not duplicated."""
 
-    def setup_method(self):
-        SchemaRegistry._schemas.clear()
-
     def _make_schemas(self):
         """Create two schemas that share the same enum."""
 
@@ -13,7 +13,6 @@ def test_simple_field_creation():
 
 def test_simple_schema_creation():
     """Test basic schema creation"""
-    SchemaRegistry._schemas.clear()
 
     @Schema
     class TestSchema:
@@ -21,7 +20,7 @@ def test_simple_schema_creation():
 
     assert TestSchema._schema_name == "TestSchema"
     assert "name" in TestSchema._schema_fields
-    assert TestSchema in SchemaRegistry._schemas.values()
+    assert TestSchema in SchemaRegistry.get_all_schemas().values()
 
 
 if __name__ == "__main__":
@@ -17,7 +17,6 @@ class _ZodCommaOrder:
 
 class TestZodObjectCommas:
     def setup_method(self):
-        SchemaRegistry._schemas.clear()
         SchemaRegistry.register(_ZodCommaOrder)
 
     def test_zod_object_fields_have_commas(self):
@@ -44,7 +44,6 @@ class _DictListNestedParent:
 
 
 def _reregister(*classes):
-    SchemaRegistry._schemas.clear()
     for cls in classes:
         SchemaRegistry.register(cls)
 
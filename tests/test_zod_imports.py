@@ -38,7 +38,6 @@ class _ZodBar:
 
 
 def _reregister(*classes):
-    SchemaRegistry._schemas.clear()
     for cls in classes:
         SchemaRegistry.register(cls)
 